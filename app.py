@@ -6,17 +6,38 @@ Philosophy: Responsible ML audit & observability (internal tooling feel)
 NOT a hiring tool - for evaluation and transparency only.
 """
 
+import os
+
+
+def _physical_cores() -> int:
+    """Physical CPU cores (hyperthreads share a core's compute units)."""
+    try:
+        import psutil
+    except ImportError:
+        return os.cpu_count() or 1
+    return psutil.cpu_count(logical=False) or os.cpu_count() or 1
+
+
+# Thread count for torch/BLAS. Set before any third-party import: streamlit
+# and pandas pull in numpy, whose BLAS pool reads these variables on import.
+NUM_THREADS = int(os.environ.get("TORCH_NUM_THREADS", _physical_cores()))
+os.environ.setdefault("OMP_NUM_THREADS", str(NUM_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(NUM_THREADS))
+
 import streamlit as st
-import json
+import orjson
+import re
 from pathlib import Path
 import sys
 
+# Skill keywords shown in the ranking table (single-pass regex)
+SKILL_KEYWORDS = ["python", "machine learning", "sql", "java", "data", "analysis"]
+SKILL_RE = re.compile(r"\b(" + "|".join(map(re.escape, SKILL_KEYWORDS)) + r")\b", re.IGNORECASE)
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.models.semantic_model import SemanticRanker
-from src.models.tfidf_ranker import TFIDFRanker
-from src.models.hybrid_ranker import HybridRanker
+from src.utils.config import load_config
 from src.fairness.perturbations import (
     gender_pronoun_swap,
     redact_names,
@@ -24,8 +45,6 @@ from src.fairness.perturbations import (
     insert_gap
 )
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 
 # Page config - clean, professional
 st.set_page_config(
@@ -82,17 +101,52 @@ st.markdown(
 
 # Load models (cached)
 @st.cache_resource
-def load_models():
-    """Load and cache ranking models."""
+def load_models(backend: str):
+    """Load and cache ranking models.
+
+    Resume embeddings are computed once here; interactive ranking only
+    encodes the job description (and any counterfactual variant).
+    Cached separately per encoder backend ("static", "onnx" or "torch").
+    Model libraries are imported here, on first load, so the page renders
+    before the encoders are imported; torch is only imported for the
+    "onnx" and "torch" backends.
+    """
+    from src.models.tfidf_ranker import TFIDFRanker
+    from src.models.hybrid_ranker import HybridRanker
+
+    models_config = load_config()["models"]
+    semantic_config = models_config["semantic"]
+
     # Load resumes for fitting
-    with open("data/processed/resumes.json", "r") as f:
-        resumes = json.load(f)
+    resumes = orjson.loads(Path("data/processed/resumes.json").read_bytes())
     
-    # Semantic model
-    semantic_model = SemanticRanker(
-        model_name="sentence-transformers/all-MiniLM-L6-v2",
-        device="cpu"
-    )
+    # Precompute keyword skills once (keyword order preserved)
+    for r in resumes:
+        found = {m.group(1).lower() for m in SKILL_RE.finditer(r["text"])}
+        r["skills_found"] = [skill for skill in SKILL_KEYWORDS if skill in found]
+    
+    # Semantic model (optionally INT8-quantized, paid once per process)
+    if backend == "static":
+        from src.models.static_model import StaticRanker
+        semantic_model = StaticRanker(model_name=models_config["static"]["name"])
+    else:
+        import torch
+        from src.models.semantic_model import SemanticRanker
+
+        # Intra-op parallelism across cores, no inter-op oversubscription
+        torch.set_num_threads(NUM_THREADS)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # Already set by an earlier load in this process
+
+        semantic_model = SemanticRanker(
+            model_name="sentence-transformers/all-MiniLM-L6-v2",
+            device="cpu",
+            quantize=semantic_config.get("quantize", False),
+            backend=backend,
+            onnx_dir=semantic_config.get("onnx_dir")
+        )
     semantic_model.fit(resumes)
     
     # TF-IDF baseline
@@ -111,18 +165,53 @@ def load_models():
     )
     hybrid_model.fit(resumes)
     
-    return semantic_model, tfidf_model, hybrid_model, resumes
+    # O(1) resume lookup by id
+    resumes_by_id = {r["id"]: r for r in resumes}
+    
+    return semantic_model, tfidf_model, hybrid_model, resumes, resumes_by_id
 
 @st.cache_data
 def load_job_descriptions():
     """Load job descriptions."""
-    with open("data/processed/job_descriptions.json", "r") as f:
-        return json.load(f)
+    return orjson.loads(Path("data/processed/job_descriptions.json").read_bytes())
+
+@st.cache_resource
+def jd_index():
+    """Index job descriptions by title (first occurrence wins), built once."""
+    index = {}
+    for jd in load_job_descriptions():
+        if jd.get("title"):
+            index.setdefault(jd["title"], jd)
+    return index
+
+@st.cache_resource
+def example_job_description():
+    """Pick the pre-filled example JD once (first data scientist role)."""
+    return next(
+        (jd for title, jd in jd_index().items() if "data scientist" in title.lower()),
+        load_job_descriptions()[0]
+    )
+
+# Encoder selection (FP32 PyTorch kept for A/B correctness checks)
+encoder_choice = st.sidebar.radio(
+    "Semantic Encoder",
+    ["Static (fast)", "SBERT"],
+    help="Model2Vec static embeddings or the full SBERT transformer"
+)
+if encoder_choice == "SBERT":
+    use_fp32 = st.sidebar.toggle(
+        "FP32 PyTorch encoder",
+        value=False,
+        help="Compare against the default INT8 ONNX Runtime encoder"
+    )
+    encoder_backend = "torch" if use_fp32 else load_config()["models"]["semantic"].get("backend", "torch")
+else:
+    encoder_backend = "static"
 
 # Load data
 with st.spinner("Loading evaluation models..."):
-    semantic_model, tfidf_model, hybrid_model, resumes = load_models()
-    job_descriptions = load_job_descriptions()
+    semantic_model, tfidf_model, hybrid_model, resumes, resumes_by_id = load_models(encoder_backend)
+    jd_by_title = jd_index()
 
 # Model selector in expander (minimal UI)
 with st.expander("⚙️ Model Configuration", expanded=False):
@@ -141,6 +230,8 @@ with st.expander("⚙️ Model Configuration", expanded=False):
     else:
         model = tfidf_model
         st.caption("Sparse bag-of-words representation")
+    
+    st.caption(f"Torch threads: {NUM_THREADS}")
 
 # Main tabs - TWO ONLY
 tab1, tab2 = st.tabs(["📄 Ranking Demo", "🧪 Fairness & Stability Audit"])
@@ -154,7 +245,7 @@ with tab1:
     st.markdown("#### Job Description (example input)")
     
     # Pre-filled example
-    example_jd = next((jd for jd in job_descriptions if "data scientist" in jd.get("title", "").lower()), job_descriptions[0])
+    example_jd = example_job_description()
     
     jd_input = st.text_area(
         "Enter or modify job description",
@@ -171,8 +262,8 @@ with tab1:
     # Run Ranking Button
     if st.button("Run Relevance Ranking", type="primary", use_container_width=True):
         with st.spinner("Computing rankings..."):
-            # Rank resumes
-            rankings = model.rank(jd_input, resumes)
+            # Rank resumes (fitted corpus, cached embeddings)
+            rankings = model.rank(jd_input)
             top_rankings = rankings[:num_resumes]
             
             st.markdown("#### Ranking Results")
@@ -180,15 +271,10 @@ with tab1:
             # Clean table
             results_data = []
             for rank, (resume_id, score) in enumerate(top_rankings, 1):
-                resume = next(r for r in resumes if r["id"] == resume_id)
+                resume = resumes_by_id[resume_id]
                 
-                # Extract top skills (simple keyword extraction)
-                text = resume["text"].lower()
-                skills = []
-                skill_keywords = ["python", "machine learning", "sql", "java", "data", "analysis"]
-                for skill in skill_keywords:
-                    if skill in text:
-                        skills.append(skill)
+                # Top skills (precomputed keyword extraction)
+                skills = resume["skills_found"]
                 
                 results_data.append({
                     "Rank": rank,
@@ -221,9 +307,9 @@ with tab2:
     
     with col1:
         # Job description (same as tab 1)
-        audit_jd_titles = [jd["title"] for jd in job_descriptions if jd.get("title")]
-        audit_jd_title = st.selectbox("Job Description", audit_jd_titles[:10], label_visibility="collapsed")
-        audit_jd = next(jd for jd in job_descriptions if jd.get("title") == audit_jd_title)
+        audit_jd_titles = list(jd_by_title)[:10]
+        audit_jd_title = st.selectbox("Job Description", audit_jd_titles, label_visibility="collapsed")
+        audit_jd = jd_by_title[audit_jd_title]
         st.caption(f"Selected: {audit_jd_title}")
     
     with col2:
@@ -292,16 +378,16 @@ with tab2:
                 "text": variant_text
             }
             
-            # Rank both
-            original_ranking = model.rank(audit_jd["text"], resumes)
-            variant_ranking = model.rank(audit_jd["text"], [variant_resume] + [r for r in resumes if r["id"] != test_resume["id"]])
-            
-            # Find ranks and scores
-            original_rank = next((i+1 for i, (rid, _) in enumerate(original_ranking) if rid == test_resume["id"]), None)
-            variant_rank = next((i+1 for i, (rid, _) in enumerate(variant_ranking) if rid == variant_resume["id"]), None)
+            # Score the fitted corpus once; only the variant is scored fresh
+            corpus_scores = model.corpus_scores(audit_jd["text"])
+            original_score = float(corpus_scores[resume_idx])
+            variant_score = model.score(variant_resume, audit_jd["text"])
             
-            original_score = next((s for rid, s in original_ranking if rid == test_resume["id"]), 0)
-            variant_score = next((s for rid, s in variant_ranking if rid == variant_resume["id"]), 0)
+            # Rank = 1 + number of other resumes scoring strictly higher (O(N), no sort)
+            original_rank = 1 + int((corpus_scores > original_score).sum())
+            variant_rank = (
+                1 + int((corpus_scores > variant_score).sum()) - int(original_score > variant_score)
+            )
             
             # Calculate changes
             rank_change = variant_rank - original_rank
@@ -346,26 +432,15 @@ with tab2:
             # Visualization (existing bar chart)
             st.markdown("**Sensitivity Visualization**")
             
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=["Rank Change", "Score Change (×10)"],
-                y=[abs(rank_change), abs(score_change * 10)],
-                marker_color=['#718096', '#4a5568'],
-                text=[f"{rank_change:+d}", f"{score_change:+.2f}"],
-                textposition='outside'
-            ))
-            
-            fig.update_layout(
-                title="Magnitude of Changes",
-                yaxis_title="Absolute Change",
-                showlegend=False,
-                height=300,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)'
+            st.bar_chart(
+                pd.DataFrame(
+                    {"Absolute Change": [abs(rank_change), abs(score_change * 10)]},
+                    index=["Rank Change", "Score Change (×10)"]
+                ),
+                color="#4a5568",
+                height=300
             )
             
-            st.plotly_chart(fig, use_container_width=True)
-            
             # Interpretation Box (static, professional)
             st.markdown(
                 '<div class="audit-note">'
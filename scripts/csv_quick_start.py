@@ -6,7 +6,7 @@ Minimal dependencies version for immediate use with your CSV files.
 """
 
 import pandas as pd
-import json
+import orjson
 from pathlib import Path
 import ast
 import re
@@ -16,78 +16,99 @@ print("Resume Ranking System - CSV Quick Start")
 print("=" * 80)
 print()
 
-# Load resume CSV
+NUM_RESUMES = 400
+NUM_JOB_DESCRIPTIONS = 100
+
+# Load resume CSV (only the columns and rows we use)
 print("📊 Loading resume_data.csv...")
-resume_df = pd.read_csv("resume_data.csv")
-print(f"   Found {len(resume_df)} resumes")
+resume_df = pd.read_csv(
+    "resume_data.csv",
+    usecols=["career_objective", "skills", "professional_company_names", "positions"],
+    nrows=NUM_RESUMES,
+)
+print(f"   Loaded {len(resume_df)} resumes")
 
 # Process first 400 resumes for better evaluation
-print("\n🔄 Processing resumes (using 400 for robust evaluation)...")
-resumes = []
+print(f"\n🔄 Processing resumes (using {NUM_RESUMES} for robust evaluation)...")
+
+
+def parse_list(value):
+    """Parse a list literal cell, returning [] for anything unparsable."""
+    try:
+        parsed = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return []
+    return parsed if isinstance(parsed, list) else []
 
-for idx, row in resume_df.head(400).iterrows():
-    # Build resume text
+
+def build_text(objective, skills, companies, positions):
+    """Assemble resume text from pre-parsed columns."""
     sections = []
     
     # Career objective
-    if pd.notna(row.get('career_objective')):
-        sections.append(f"SUMMARY:\n{row['career_objective']}\n")
+    if pd.notna(objective):
+        sections.append(f"SUMMARY:\n{objective}\n")
     
     # Skills
-    try:
-        skills = ast.literal_eval(str(row.get('skills', '[]'))) if pd.notna(row.get('skills')) else []
-        if skills:
-            sections.append(f"SKILLS:\n{', '.join(skills)}\n")
-    except:
-        skills = []
+    if skills:
+        sections.append(f"SKILLS:\n{', '.join(skills)}\n")
     
     # Experience
-    try:
-        companies = ast.literal_eval(str(row.get('professional_company_names', '[]')))
-        positions = ast.literal_eval(str(row.get('positions', '[]')))
-        
-        if companies or positions:
-            sections.append("EXPERIENCE:")
-            for i in range(max(len(companies) if isinstance(companies, list) else 0, 
-                              len(positions) if isinstance(positions, list) else 0)):
-                exp_line = []
-                if isinstance(positions, list) and i < len(positions):
-                    exp_line.append(positions[i])
-                if isinstance(companies, list) and i < len(companies):
-                    exp_line.append(f"at {companies[i]}")
-                if exp_line:
-                    sections.append(" ".join(exp_line))
-    except:
-        pass
+    if companies or positions:
+        sections.append("EXPERIENCE:")
+        for i in range(max(len(companies), len(positions))):
+            exp_line = []
+            if i < len(positions) and positions[i] is not None:
+                exp_line.append(positions[i])
+            if i < len(companies) and companies[i] is not None:
+                exp_line.append(f"at {companies[i]}")
+            if exp_line:
+                sections.append(" ".join(exp_line))
     
-    text = "\n".join(sections)
-    
-    resume = {
+    return "\n".join(sections)
+
+
+# Parse list columns once per column
+skills_col = resume_df["skills"].fillna("[]").map(parse_list)
+companies_col = resume_df["professional_company_names"].fillna("[]").map(parse_list)
+positions_col = resume_df["positions"].fillna("[]").map(parse_list)
+
+resumes = [
+    {
         "id": f"resume_{idx:06d}",
-        "text": text,
-        "skills": skills if isinstance(skills, list) else [],
+        "text": build_text(objective, skills, companies, positions),
+        "skills": skills,
     }
-    
-    resumes.append(resume)
+    for idx, objective, skills, companies, positions in zip(
+        resume_df.index,
+        resume_df["career_objective"].values,
+        skills_col.values,
+        companies_col.values,
+        positions_col.values,
+    )
+]
 
 # Save resumes
 Path("data/processed").mkdir(parents=True, exist_ok=True)
-with open("data/processed/resumes.json", "w") as f:
-    json.dump(resumes, f, indent=2)
+Path("data/processed/resumes.json").write_bytes(orjson.dumps(resumes))
 
 print(f"✅ Processed {len(resumes)} resumes")
 print(f"   Saved to: data/processed/resumes.json")
 
 # Load job description CSV
 print("\n📊 Loading job_title_des.csv...")
-jd_df = pd.read_csv("job_title_des.csv")
-print(f"   Found {len(jd_df)} job descriptions")
+jd_df = pd.read_csv(
+    "job_title_des.csv",
+    usecols=["Job Title", "Job Description"],
+    nrows=NUM_JOB_DESCRIPTIONS,
+)
+print(f"   Loaded {len(jd_df)} job descriptions")
 
 # Process first 100 job descriptions for better coverage
-print("\n🔄 Processing job descriptions (using 100 for diversity)...")
+print(f"\n🔄 Processing job descriptions (using {NUM_JOB_DESCRIPTIONS} for diversity)...")
 job_descriptions = []
 
-for idx, row in jd_df.head(100).iterrows():
+for idx, row in jd_df.iterrows():
     title = row.get('Job Title', '')
     description = row.get('Job Description', '')
     
@@ -103,8 +124,7 @@ for idx, row in jd_df.head(100).iterrows():
     job_descriptions.append(jd)
 
 # Save job descriptions
-with open("data/processed/job_descriptions.json", "w") as f:
-    json.dump(job_descriptions, f, indent=2)
+Path("data/processed/job_descriptions.json").write_bytes(orjson.dumps(job_descriptions))
 
 print(f"✅ Processed {len(job_descriptions)} job descriptions")
 print(f"   Saved to: data/processed/job_descriptions.json")
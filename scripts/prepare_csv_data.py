@@ -12,7 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import yaml
-import json
+import orjson
 from src.data.csv_loader import CSVResumeLoader, CSVJobDescriptionLoader
 from src.data.preprocessor import TextPreprocessor
 from src.data.privacy import PIIRedactor
@@ -50,19 +50,15 @@ def main():
         resumes = resume_loader.process_to_dict(max_resumes=1000)  # Limit for initial testing
         
         # Apply preprocessing and PII redaction
-        for resume in resumes:
-            # Clean text
-            resume["text"] = preprocessor.clean(resume["text"])
-            
-            # Redact PII
-            resume["text"] = redactor.redact(resume["text"])
+        cleaned = [preprocessor.clean(resume["text"]) for resume in resumes]
+        for resume, text in zip(resumes, redactor.redact_many(cleaned)):
+            resume["text"] = text
         
         # Save processed resumes
         output_path = Path(config["data"]["processed_resumes"])
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w") as f:
-            json.dump(resumes, f, indent=2)
+        output_path.write_bytes(orjson.dumps(resumes))
         
         print(f"\n✓ Processed {len(resumes)} resumes")
         print(f"  Saved to: {output_path}")
@@ -87,8 +83,7 @@ def main():
         output_path = Path(config["data"]["processed_job_descriptions"])
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w") as f:
-            json.dump(job_descriptions, f, indent=2)
+        output_path.write_bytes(orjson.dumps(job_descriptions))
         
         print(f"\n✓ Processed {len(job_descriptions)} job descriptions")
         print(f"  Saved to: {output_path}")
@@ -5,92 +5,293 @@ Data preparation script.
 Processes raw resume PDFs and job descriptions into structured JSON format.
 """
 
+import argparse
+import hashlib
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from collections import deque
+from itertools import islice
+from typing import Dict, Iterator, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import yaml
 import json
+import orjson
 from src.data.parser import ResumeParser, JobDescriptionParser
 from src.data.preprocessor import TextPreprocessor
 from src.data.privacy import PIIRedactor
+from src.data.loader import stream_records
 
+# PDF parsing is CPU-bound; returns flatten beyond a handful of processes
+MAX_PARSE_WORKERS = min(os.cpu_count() or 1, 6)
+
+# Files submitted ahead of the one being consumed (keeps workers busy
+# without queueing, and retaining results for, the whole directory)
+MAX_IN_FLIGHT = 2 * MAX_PARSE_WORKERS
+
+# PyMuPDF extracts plain text far faster than pdfplumber's layout analysis
+PARSER_OPTIONS = {"use_pymupdf": True}
+
+
+def _config_version(preprocessor: TextPreprocessor, redactor: PIIRedactor) -> str:
+    """Short hash of the processing settings, so config changes miss the cache."""
+    settings = {
+        "parser": PARSER_OPTIONS,
+        "preprocessor": [preprocessor.lowercase, preprocessor.remove_special_chars],
+        "redactor": [redactor.redact_names, redactor.redact_contact],
+    }
+    # Stdlib json keeps the serialization, and so existing cache keys, unchanged
+    return hashlib.sha256(json.dumps(settings).encode()).hexdigest()[:12]
+
+
+def _file_hash(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
 
-def prepare_resumes(raw_dir: Path, preprocessor: TextPreprocessor, redactor: PIIRedactor) -> list:
-    """Prepare resume data.
+
+def _load_failures(path: Path) -> Dict[str, str]:
+    """Load the skip list of files that failed before (content hash -> error)."""
+    if not path.exists():
+        return {}
+    return orjson.loads(path.read_bytes())
+
+
+def _save_failures(failures: Dict[str, str], path: Path) -> None:
+    """Atomically write the skip list of failed files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(failures, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+
+def _process_one_resume(
+    pdf_path: Path,
+    idx: int,
+    preprocessor: TextPreprocessor,
+    redactor: PIIRedactor,
+    cache_dir: Optional[Path] = None,
+    pdf_hash: Optional[str] = None,
+    text_cache_dir: Optional[Path] = None,
+) -> dict:
+    """Parse, clean, and redact a single resume PDF (runs in a worker process).
 
     Args:
-        raw_dir: Directory containing resume PDFs
+        pdf_path: Path to the resume PDF
+        idx: 1-based position of the file, used for the resume id
         preprocessor: Text preprocessor
         redactor: PII redactor
+        cache_dir: Directory of processed resumes keyed by PDF content hash
+            (None disables caching)
+        pdf_hash: Content hash of the PDF, if already computed
+        text_cache_dir: Directory of raw extracted PDF texts, reused when
+            only the cleaning/redaction settings changed (None disables it)
 
     Returns:
-        List of processed resume dictionaries
+        Processed resume dictionary
     """
-    parser = ResumeParser(use_pdfplumber=True)
-    resumes = []
+    resume_id = f"resume_{idx:04d}"
+
+    cache_path = None
+    if cache_dir is not None:
+        pdf_hash = pdf_hash or _file_hash(pdf_path)
+        cache_path = cache_dir / f"{pdf_hash}_{_config_version(preprocessor, redactor)}.json"
+        if cache_path.exists():
+            try:
+                cached = orjson.loads(cache_path.read_bytes())
+            except orjson.JSONDecodeError:
+                # Unreadable entry (e.g. left by an older non-atomic write): reparse
+                cached = None
+            if cached is not None:
+                return {"id": resume_id, "filename": pdf_path.name, **cached}
+
+    parser = ResumeParser(**PARSER_OPTIONS, cache_dir=text_cache_dir)
+
+    # Parse PDF
+    text = parser.parse_pdf(pdf_path)
+
+    # Clean text
+    text = preprocessor.clean(text)
+
+    # Redact PII
+    text = redactor.redact(text)
+
+    # Extract sections and skills
+    sections = parser.extract_sections(text)
+    skills = parser.extract_skills(text)
+    years_exp = parser.extract_years_experience(text)
+
+    processed = {
+        "text": text,
+        "sections": sections,
+        "skills": skills,
+        "years_experience": years_exp,
+    }
+
+    if cache_path is not None:
+        # Write atomically so an interrupted or concurrent run never leaves a
+        # truncated entry behind
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(processed))
+        os.replace(tmp_path, cache_path)
+
+    return {"id": resume_id, "filename": pdf_path.name, **processed}
+
+
+def iter_resumes(
+    raw_dir: Path,
+    preprocessor: TextPreprocessor,
+    redactor: PIIRedactor,
+    cache_dir: Optional[Path] = None,
+    failures: Optional[Dict[str, str]] = None,
+    text_cache_dir: Optional[Path] = None,
+) -> Iterator[dict]:
+    """Yield processed resumes in file order as workers finish them.
 
-    pdf_files = list(raw_dir.glob("*.pdf"))
+    Args:
+        raw_dir: Directory containing resume PDFs
+        preprocessor: Text preprocessor
+        redactor: PII redactor
+        cache_dir: Directory for the parsed-resume cache (None disables it)
+        failures: Skip list of content hashes that failed before; files in it
+            are skipped and new failures are added (None disables it)
+        text_cache_dir: Directory for the extracted-text cache (None disables it)
+
+    Yields:
+        Processed resume dictionaries
+    """
+    # Sorted so positional resume ids are stable across filesystems and runs
+    pdf_files = sorted(raw_dir.glob("*.pdf"))
 
     if not pdf_files:
         print(f"Warning: No PDF files found in {raw_dir}")
-        return []
+        return
 
     print(f"Processing {len(pdf_files)} resumes...")
 
-    for i, pdf_path in enumerate(pdf_files, 1):
-        try:
-            # Parse PDF
-            text = parser.parse_pdf(pdf_path)
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Files are processed in parallel; results are collected in file order
+    with ProcessPoolExecutor(max_workers=MAX_PARSE_WORKERS) as executor:
+
+        def submit(i: int, pdf_path: Path) -> tuple:
+            # Hashed on submission, so hashing overlaps with parsing
+            pdf_hash = _file_hash(pdf_path) if cache_dir or failures is not None else None
+            if failures is not None and pdf_hash in failures:
+                print(f"  Skipping {pdf_path.name}: failed previously ({failures[pdf_hash]})")
+                return pdf_path, pdf_hash, None
+            return pdf_path, pdf_hash, executor.submit(
+                _process_one_resume, pdf_path, i, preprocessor, redactor,
+                cache_dir, pdf_hash, text_cache_dir,
+            )
+
+        # Only a bounded window of files is in flight; the next file is
+        # submitted as each result is consumed
+        remaining = enumerate(pdf_files, 1)
+        pending = deque(submit(i, pdf_path) for i, pdf_path in islice(remaining, MAX_IN_FLIGHT))
+
+        # Futures are dropped once consumed, so finished resumes are not retained
+        for i in range(1, len(pdf_files) + 1):
+            pdf_path, pdf_hash, future = pending.popleft()
+            next_file = next(remaining, None)
+            if next_file is not None:
+                pending.append(submit(*next_file))
+            if future is None:
+                continue
+            try:
+                resume = future.result()
+            except Exception as e:
+                print(f"  Error processing {pdf_path.name}: {e}")
+                if failures is not None:
+                    failures[pdf_hash] = str(e)
+                continue
+
+            yield resume
+
+            if i % 10 == 0:
+                print(f"  Processed {i}/{len(pdf_files)} resumes...")
+
+
+def prepare_resumes(
+    raw_dir: Path,
+    preprocessor: TextPreprocessor,
+    redactor: PIIRedactor,
+    cache_dir: Optional[Path] = None,
+    failures: Optional[Dict[str, str]] = None,
+    text_cache_dir: Optional[Path] = None,
+) -> list:
+    """Prepare resume data.
+
+    Args:
+        raw_dir: Directory containing resume PDFs
+        preprocessor: Text preprocessor
+        redactor: PII redactor
+        cache_dir: Directory for the parsed-resume cache (None disables it)
+        failures: Skip list of previously failed content hashes (None disables it)
+        text_cache_dir: Directory for the extracted-text cache (None disables it)
 
-            # Clean text
-            text = preprocessor.clean(text)
+    Returns:
+        List of processed resume dictionaries
+    """
+    return list(
+        iter_resumes(raw_dir, preprocessor, redactor, cache_dir, failures, text_cache_dir)
+    )
 
-            # Redact PII
-            text = redactor.redact(text)
 
-            # Extract sections and skills
-            sections = parser.extract_sections(text)
-            skills = parser.extract_skills(text)
-            years_exp = parser.extract_years_experience(text)
+def _process_one_jd(file_path: Path, idx: int, preprocessor: TextPreprocessor) -> dict:
+    """Parse and clean a single job description file (runs in a worker process).
 
-            resume = {
-                "id": f"resume_{i:04d}",
-                "filename": pdf_path.name,
-                "text": text,
-                "sections": sections,
-                "skills": skills,
-                "years_experience": years_exp,
-            }
+    Args:
+        file_path: Path to a .txt or .pdf job description
+        idx: 1-based position of the file, used for the job description id
+        preprocessor: Text preprocessor
 
-            resumes.append(resume)
+    Returns:
+        Processed job description dictionary
+    """
+    # Parse file
+    text = JobDescriptionParser.parse(file_path, ResumeParser(**PARSER_OPTIONS))
 
-            if i % 10 == 0:
-                print(f"  Processed {i}/{len(pdf_files)} resumes...")
+    # Clean text
+    text = preprocessor.clean(text)
 
-        except Exception as e:
-            print(f"  Error processing {pdf_path.name}: {e}")
-            continue
+    # Extract required skills
+    required_skills = JobDescriptionParser.extract_required_skills(text)
 
-    return resumes
+    return {
+        "id": f"jd_{idx:04d}",
+        "filename": file_path.name,
+        "text": text,
+        "required_skills": required_skills,
+    }
 
 
-def prepare_job_descriptions(raw_dir: Path, preprocessor: TextPreprocessor) -> list:
+def prepare_job_descriptions(
+    raw_dir: Path,
+    preprocessor: TextPreprocessor,
+    failures: Optional[Dict[str, str]] = None,
+) -> list:
     """Prepare job description data.
 
     Args:
         raw_dir: Directory containing job description files
         preprocessor: Text preprocessor
+        failures: Skip list of previously failed content hashes (None disables it)
 
     Returns:
         List of processed job description dictionaries
     """
     job_descriptions = []
 
-    # Support both .txt and .pdf files
-    files = list(raw_dir.glob("*.txt")) + list(raw_dir.glob("*.pdf"))
+    # Support both .txt and .pdf files, in one pass ordered by filename
+    files = sorted(
+        list(raw_dir.glob("*.txt")) + list(raw_dir.glob("*.pdf")),
+        key=lambda path: path.name,
+    )
 
     if not files:
         print(f"Warning: No job description files found in {raw_dir}")
@@ -98,35 +299,44 @@ def prepare_job_descriptions(raw_dir: Path, preprocessor: TextPreprocessor) -> l
 
     print(f"Processing {len(files)} job descriptions...")
 
-    for i, file_path in enumerate(files, 1):
-        try:
-            # Parse file
-            text = JobDescriptionParser.parse(file_path)
-
-            # Clean text
-            text = preprocessor.clean(text)
-
-            # Extract required skills
-            required_skills = JobDescriptionParser.extract_required_skills(text)
-
-            jd = {
-                "id": f"jd_{i:04d}",
-                "filename": file_path.name,
-                "text": text,
-                "required_skills": required_skills,
-            }
-
-            job_descriptions.append(jd)
-
-        except Exception as e:
-            print(f"  Error processing {file_path.name}: {e}")
-            continue
+    with ProcessPoolExecutor(max_workers=MAX_PARSE_WORKERS) as executor:
+        futures = []
+        for i, file_path in enumerate(files, 1):
+            file_hash = _file_hash(file_path) if failures is not None else None
+            if failures is not None and file_hash in failures:
+                print(f"  Skipping {file_path.name}: failed previously ({failures[file_hash]})")
+                continue
+            futures.append(
+                (file_path, file_hash, executor.submit(_process_one_jd, file_path, i, preprocessor))
+            )
+
+        for file_path, file_hash, future in futures:
+            try:
+                job_descriptions.append(future.result())
+            except Exception as e:
+                print(f"  Error processing {file_path.name}: {e}")
+                if failures is not None:
+                    failures[file_hash] = str(e)
+                continue
 
     return job_descriptions
 
 
 def main():
     """Run data preparation."""
+    parser = argparse.ArgumentParser(description="Prepare resume and job description data")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every resume PDF instead of reusing cached results",
+    )
+    parser.add_argument(
+        "--retry-failures",
+        action="store_true",
+        help="Retry files that failed on a previous run instead of skipping them",
+    )
+    args = parser.parse_args()
+
     print("=" * 80)
     print("Resume Ranking System - Data Preparation")
     print("=" * 80)
@@ -149,38 +359,45 @@ def main():
 
     # Prepare resumes
     raw_resume_dir = Path(config["data"]["raw_resumes"])
-    resumes = prepare_resumes(raw_resume_dir, preprocessor, redactor)
-
-    if resumes:
-        # Save resumes
-        output_path = Path(config["data"]["processed_resumes"])
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, "w") as f:
-            json.dump(resumes, f, indent=2)
+    cache_dir = None if args.no_cache else Path(config["data"]["resume_cache_dir"])
+    text_cache_dir = None if args.no_cache else Path(config["data"]["pdf_text_cache_dir"])
+    failures_path = Path(config["data"]["failure_list"])
+    failures = {} if args.retry_failures else _load_failures(failures_path)
+    output_path = Path(config["data"]["processed_resumes"])
+
+    # Stream resumes to disk as they are processed
+    num_resumes = stream_records(
+        iter_resumes(
+            raw_resume_dir, preprocessor, redactor, cache_dir, failures, text_cache_dir
+        ),
+        output_path,
+    )
 
-        print(f"\n✓ Processed {len(resumes)} resumes")
+    if num_resumes:
+        print(f"\n✓ Processed {num_resumes} resumes")
         print(f"  Saved to: {output_path}")
     else:
         print("\n⚠ No resumes processed")
 
     # Prepare job descriptions
     raw_jd_dir = Path(config["data"]["raw_job_descriptions"])
-    job_descriptions = prepare_job_descriptions(raw_jd_dir, preprocessor)
+    job_descriptions = prepare_job_descriptions(raw_jd_dir, preprocessor, failures)
 
     if job_descriptions:
         # Save job descriptions
         output_path = Path(config["data"]["processed_job_descriptions"])
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(job_descriptions, f, indent=2)
+        output_path.write_bytes(orjson.dumps(job_descriptions))
 
         print(f"\n✓ Processed {len(job_descriptions)} job descriptions")
         print(f"  Saved to: {output_path}")
     else:
         print("\n⚠ No job descriptions processed")
 
+    # Remember files that failed so reruns skip them (unless --retry-failures)
+    _save_failures(failures, failures_path)
+
     print("\n" + "=" * 80)
     print("Data preparation complete!")
     print("=" * 80)
@@ -11,20 +11,13 @@ Runs complete evaluation pipeline:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.data.loader import load_resumes, load_job_descriptions
-from src.models.tfidf_ranker import TFIDFRanker
-from src.models.bm25_ranker import BM25Ranker
-from src.models.semantic_model import SemanticRanker
-from src.models.hybrid_ranker import HybridRanker
-from src.evaluation.evaluator import ModelEvaluator
-from src.fairness.counterfactual import CounterfactualTester
-from src.reporting.report_generator import ReportGenerator
-from src.reporting.visualizations import create_fairness_visualizations, create_all_advanced_visualizations
 from src.utils.config import load_config
 
 
@@ -51,30 +44,50 @@ def main():
         print("Place your resume PDFs in data/raw/resumes/ and job descriptions in data/raw/job_descriptions/")
         return
 
+    # Heavy imports (torch, sentence-transformers, plotting) only once data is present
+    from src.models.tfidf_ranker import TFIDFRanker
+    from src.models.bm25_ranker import BM25Ranker
+    from src.models.semantic_model import SemanticRanker
+    from src.models.hybrid_ranker import HybridRanker
+    from src.evaluation.evaluator import ModelEvaluator
+    from src.fairness.counterfactual import CounterfactualTester
+    from src.reporting.report_generator import ReportGenerator
+    from src.reporting.visualizations import create_fairness_visualizations, create_all_advanced_visualizations
+
     # Initialize models
     print("\nInitializing models...")
     models = {}
 
-    # Baseline: TF-IDF
+    # The sparse baselines share no state with the semantic model. Fit them
+    # in worker threads while the encoder runs on the main thread, where
+    # torch releases the GIL for most of its work.
     print("  - TF-IDF Ranker")
-    tfidf_ranker = TFIDFRanker(**config["models"]["baseline"]["tfidf"])
-    tfidf_ranker.fit(resumes)
-    models["TF-IDF"] = tfidf_ranker
-
-    # Baseline: BM25
     print("  - BM25 Ranker")
-    bm25_ranker = BM25Ranker(**config["models"]["baseline"]["bm25"])
-    bm25_ranker.fit(resumes)
-    models["BM25"] = bm25_ranker
-
-    # Semantic model
-    print("  - Semantic Ranker")
-    semantic_ranker = SemanticRanker(
-        model_name=config["models"]["semantic"]["name"],
-        device=config["models"]["semantic"]["device"],
-    )
-    semantic_ranker.fit(resumes)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tfidf_future = executor.submit(
+            TFIDFRanker(**config["models"]["baseline"]["tfidf"]).fit, resumes
+        )
+        bm25_future = executor.submit(
+            BM25Ranker(**config["models"]["baseline"]["bm25"]).fit, resumes
+        )
+
+        # Semantic model
+        print("  - Semantic Ranker")
+        semantic_ranker = SemanticRanker(
+            model_name=config["models"]["semantic"]["name"],
+            device=config["models"]["semantic"]["device"],
+            embedding_cache_dir=(
+                config["models"]["semantic"]["embedding_cache_dir"]
+                if config["performance"]["cache_embeddings"] else None
+            ),
+        )
+        semantic_ranker.fit(resumes)
+
+        # Baselines: TF-IDF and BM25
+        models["TF-IDF"] = tfidf_future.result()
+        models["BM25"] = bm25_future.result()
     models["Semantic"] = semantic_ranker
+    tfidf_ranker = models["TF-IDF"]
 
     # Hybrid model (production-realistic)
     print("  - Hybrid Ranker (Semantic + Structured Signals)")
@@ -94,6 +107,15 @@ def main():
     print("\nRunning fairness tests...")
     print("(Using first job description as example)")
 
+    # Perturb the test subset once; all three testers rank the same variants
+    fairness_resumes = resumes[:50]  # Test on subset for speed
+    university_tiers = config["fairness"]["university_swap"]["prestige_tiers"]
+    perturbations = CounterfactualTester.build_perturbations(
+        fairness_resumes,
+        config["fairness"],
+        university_tiers=university_tiers,
+    )
+
     # Test on hybrid model (primary - most realistic)
     print("\n🔬 Testing Hybrid Model (Production-Realistic)...")
     tester_hybrid = CounterfactualTester(
@@ -102,9 +124,10 @@ def main():
     )
 
     fairness_results_hybrid = tester_hybrid.run_all_tests(
-        resumes[:50],  # Test on subset for speed
+        fairness_resumes,
         job_descriptions[0]["text"],
-        university_tiers=config["fairness"]["university_swap"]["prestige_tiers"]
+        university_tiers=university_tiers,
+        perturbations=perturbations
     )
 
     # Test on semantic model (for comparison)
@@ -115,9 +138,10 @@ def main():
     )
 
     fairness_results_semantic = tester_semantic.run_all_tests(
-        resumes[:50],  # Test on subset for speed
+        fairness_resumes,
         job_descriptions[0]["text"],
-        university_tiers=config["fairness"]["university_swap"]["prestige_tiers"]
+        university_tiers=university_tiers,
+        perturbations=perturbations
     )
 
     # Ablation: Test on TF-IDF for comparison
@@ -128,30 +152,36 @@ def main():
     )
 
     fairness_results_tfidf = tester_tfidf.run_all_tests(
-        resumes[:50],
+        fairness_resumes,
         job_descriptions[0]["text"],
-        university_tiers=config["fairness"]["university_swap"]["prestige_tiers"]
+        university_tiers=university_tiers,
+        perturbations=perturbations
     )
 
-    # Generate fairness reports for all models
-    fairness_report_hybrid = tester_hybrid.generate_fairness_report(
-        fairness_results_hybrid,
-        threshold_rank_change=config["fairness"]["thresholds"]["max_mean_rank_change"],
-        threshold_affected_pct=config["fairness"]["thresholds"]["max_affected_percentage"],
-    )
-
-    fairness_report_semantic = tester_semantic.generate_fairness_report(
-        fairness_results_semantic,
-        threshold_rank_change=config["fairness"]["thresholds"]["max_mean_rank_change"],
-        threshold_affected_pct=config["fairness"]["thresholds"]["max_affected_percentage"],
-    )
-
-    # Generate fairness report for TF-IDF (ablation)
-    fairness_report_tfidf = tester_tfidf.generate_fairness_report(
-        fairness_results_tfidf,
-        threshold_rank_change=config["fairness"]["thresholds"]["max_mean_rank_change"],
-        threshold_affected_pct=config["fairness"]["thresholds"]["max_affected_percentage"],
-    )
+    # Generate fairness reports for all models (TF-IDF is the ablation baseline)
+    thresholds = config["fairness"]["thresholds"]
+    reports_by_model = {
+        name: tester.generate_fairness_report(
+            results,
+            threshold_rank_change=thresholds["max_mean_rank_change"],
+            threshold_affected_pct=thresholds["max_affected_percentage"],
+        )
+        for name, tester, results in (
+            ("Hybrid", tester_hybrid, fairness_results_hybrid),
+            ("Semantic", tester_semantic, fairness_results_semantic),
+            ("TF-IDF", tester_tfidf, fairness_results_tfidf),
+        )
+    }
+    fairness_report_hybrid = reports_by_model["Hybrid"]
+    fairness_report_semantic = reports_by_model["Semantic"]
+    fairness_report_tfidf = reports_by_model["TF-IDF"]
+
+    # Pass/fail plus per-test summary, shared by reference between the
+    # ablation and legacy files so the two cannot drift apart
+    outcomes_by_model = {
+        name: {"overall_passed": report["overall_passed"], "summary": report["summary"]}
+        for name, report in reports_by_model.items()
+    }
 
     # Generate reports
     print("\nGenerating reports...")
@@ -164,7 +194,8 @@ def main():
     reporter.generate_fairness_report(fairness_report_semantic, "fairness_report_semantic")
 
     # Save comprehensive ablation results
-    import json
+    import orjson
+    json_options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
     ablation_path = Path(config["reporting"]["output_dir"]) / "ablation_study_complete.json"
     ablation_results = {
         "hybrid_model": {
@@ -176,20 +207,17 @@ def main():
                 "employment_continuity": 0.10,
                 "other_signals": 0.05
             },
-            "overall_passed": fairness_report_hybrid["overall_passed"],
-            "summary": fairness_report_hybrid["summary"]
+            **outcomes_by_model["Hybrid"],
         },
         "semantic_only": {
             "model": "sentence-transformers/all-MiniLM-L6-v2",
             "description": "Pure embedding model - all signals implicit in text",
-            "overall_passed": fairness_report_semantic["overall_passed"],
-            "summary": fairness_report_semantic["summary"]
+            **outcomes_by_model["Semantic"],
         },
         "tfidf_baseline": {
             "model": "TF-IDF (sklearn)",
             "description": "Sparse bag-of-words representation",
-            "overall_passed": fairness_report_tfidf["overall_passed"],
-            "summary": fairness_report_tfidf["summary"]
+            **outcomes_by_model["TF-IDF"],
         },
         "key_insights": {
             "university_prestige": "Hybrid model shows EXPLICIT university effect (auditable), semantic shows IMPLICIT effect (accidental)",
@@ -197,8 +225,7 @@ def main():
             "production_realism": "Hybrid architecture reflects how real systems combine semantic relevance with structured signals"
         }
     }
-    with open(ablation_path, "w") as f:
-        json.dump(ablation_results, f, indent=2)
+    ablation_path.write_bytes(orjson.dumps(ablation_results, option=json_options))
     print(f"Complete ablation study saved to {ablation_path}")
     
     # Also save legacy format for backward compatibility
@@ -206,18 +233,15 @@ def main():
     legacy_results = {
         "semantic_model": {
             "model": "sentence-transformers/all-MiniLM-L6-v2",
-            "overall_passed": fairness_report_semantic["overall_passed"],
-            "summary": fairness_report_semantic["summary"]
+            **outcomes_by_model["Semantic"],
         },
         "tfidf_baseline": {
             "model": "TF-IDF (sklearn)",
-            "overall_passed": fairness_report_tfidf["overall_passed"],
-            "summary": fairness_report_tfidf["summary"]
+            **outcomes_by_model["TF-IDF"],
         },
         "insights": "Comparing representation-based fairness: TF-IDF (sparse) vs SBERT (dense embeddings)"
     }
-    with open(legacy_path, "w") as f:
-        json.dump(legacy_results, f, indent=2)
+    legacy_path.write_bytes(orjson.dumps(legacy_results, option=json_options))
 
     # Model card (for hybrid model - primary)
     reporter.generate_model_card(
@@ -240,13 +264,8 @@ def main():
         )
         
         # Advanced visualizations (distribution, heatmap)
-        all_model_results = {
-            "Hybrid": fairness_report_hybrid,
-            "Semantic": fairness_report_semantic,
-            "TF-IDF": fairness_report_tfidf
-        }
         create_all_advanced_visualizations(
-            all_model_results,
+            reports_by_model,
             config["reporting"]["output_dir"]
         )
 
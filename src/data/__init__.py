@@ -8,13 +8,14 @@ Handles:
 - Data splitting
 """
 
-from .loader import load_resumes, load_job_descriptions
+from .loader import load_resumes, load_resumes_iter, load_job_descriptions
 from .parser import ResumeParser
 from .preprocessor import TextPreprocessor
 from .privacy import PIIRedactor
 
 __all__ = [
     "load_resumes",
+    "load_resumes_iter",
     "load_job_descriptions",
     "ResumeParser",
     "TextPreprocessor",
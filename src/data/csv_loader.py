@@ -4,15 +4,78 @@ Handles CSV format datasets instead of PDF files.
 """
 
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import ast
 import re
+from itertools import islice, zip_longest
+
+YEAR_PATTERN = re.compile(r'\d{4}')
+CURRENT_YEAR = 2026
+
+
+@lru_cache(maxsize=65536)
+def _start_year(date: str) -> Optional[int]:
+    """Extract the year from a start date string (memoized per distinct string)."""
+    match = YEAR_PATTERN.search(date)
+    return int(match.group()) if match else None
+
+
+@lru_cache(maxsize=65536)
+def _end_year(date: str) -> Optional[int]:
+    """Extract the year from an end date string, mapping ongoing roles to CURRENT_YEAR."""
+    date = date.lower()
+    if 'till date' in date or 'present' in date:
+        return CURRENT_YEAR
+    match = YEAR_PATTERN.search(date)
+    return int(match.group()) if match else None
+
+
+@lru_cache(maxsize=65536)
+def _parse_literal_list(value: str) -> Optional[Tuple[str, ...]]:
+    """Parse a list literal once per distinct string.
+
+    List columns repeat heavily across resumes, so results are memoized.
+
+    Args:
+        value: String representation of a list
+
+    Returns:
+        Tuple of non-empty items as strings, or None if value is not a list literal
+    """
+    try:
+        parsed = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return None
+    if isinstance(parsed, list):
+        return tuple(str(item) for item in parsed if item)
+    return None
 
 
 class CSVResumeLoader:
     """Load and process resume data from CSV."""
 
+    # Columns holding string representations of lists, parsed once on load
+    LIST_COLUMNS = [
+        'skills',
+        'educational_institution_name',
+        'degree_names',
+        'major_field_of_studies',
+        'passing_years',
+        'professional_company_names',
+        'positions',
+        'start_dates',
+        'end_dates',
+        'responsibilities',
+        'languages',
+        'certification_providers',
+        'certification_skills',
+    ]
+
+    # Columns read when building resume dictionaries
+    TEXT_COLUMNS = ['career_objective'] + LIST_COLUMNS
+
     def __init__(self, csv_path: str):
         """Initialize CSV loader.
 
@@ -21,19 +84,44 @@ class CSVResumeLoader:
         """
         self.csv_path = Path(csv_path)
         self.df = None
+        # Row limit self.df was loaded with (None means every row)
+        self._loaded_nrows = None
 
-    def load(self) -> pd.DataFrame:
+    def load(self, nrows: Optional[int] = None) -> pd.DataFrame:
         """Load CSV file.
 
+        Only the columns used to build resumes are read. List-valued
+        columns are parsed into Python lists once here, so row processing
+        only indexes already-parsed values.
+
+        Args:
+            nrows: Only read the first nrows rows (None reads all)
+
         Returns:
             Pandas DataFrame
         """
         print(f"Loading resume CSV from {self.csv_path}...")
-        self.df = pd.read_csv(self.csv_path)
+        self._loaded_nrows = nrows
+        self.df = pd.read_csv(
+            self.csv_path,
+            usecols=lambda col: col in self.TEXT_COLUMNS,
+            nrows=nrows,
+        )
+        for col in self.LIST_COLUMNS:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].map(self._safe_parse_list)
         print(f"  Loaded {len(self.df)} resumes")
         print(f"  Columns: {list(self.df.columns[:10])}...")
         return self.df
 
+    def _has_rows(self, max_rows: Optional[int]) -> bool:
+        """Whether the loaded frame covers the first max_rows rows (all if falsy)."""
+        if self.df is None:
+            return False
+        if self._loaded_nrows is None:
+            return True
+        return bool(max_rows) and max_rows <= self._loaded_nrows
+
     def _safe_parse_list(self, value: Any) -> List[str]:
         """Safely parse string representation of list.
 
@@ -50,23 +138,20 @@ class CSVResumeLoader:
             return value
 
         if isinstance(value, str):
-            try:
-                # Try to parse as Python literal
-                parsed = ast.literal_eval(value)
-                if isinstance(parsed, list):
-                    return [str(item) for item in parsed if item]
-                return [value]
-            except (ValueError, SyntaxError):
-                # If parsing fails, treat as single item
-                return [value] if value.strip() else []
+            # Try to parse as Python literal (memoized per distinct string)
+            parsed = _parse_literal_list(value)
+            if parsed is not None:
+                return list(parsed)
+            # Otherwise treat as single item
+            return [value] if value.strip() else []
 
         return []
 
-    def _build_resume_text(self, row: pd.Series) -> str:
+    def _build_resume_text(self, row: Dict[str, Any]) -> str:
         """Build full resume text from CSV row.
 
         Args:
-            row: DataFrame row
+            row: Mapping of column name to value for one row
 
         Returns:
             Formatted resume text
@@ -78,67 +163,76 @@ class CSVResumeLoader:
             sections.append(f"SUMMARY:\n{row['career_objective']}\n")
 
         # Skills
-        skills = self._safe_parse_list(row.get('skills'))
+        skills = row.get('skills') or []
         if skills:
             sections.append(f"SKILLS:\n{', '.join(skills)}\n")
 
         # Education
-        institutions = self._safe_parse_list(row.get('educational_institution_name'))
-        degrees = self._safe_parse_list(row.get('degree_names'))
-        majors = self._safe_parse_list(row.get('major_field_of_studies'))
-        years = self._safe_parse_list(row.get('passing_years'))
+        institutions = row.get('educational_institution_name') or []
+        degrees = row.get('degree_names') or []
+        majors = row.get('major_field_of_studies') or []
+        years = row.get('passing_years') or []
 
         if institutions or degrees:
             sections.append("EDUCATION:")
-            for i in range(max(len(institutions), len(degrees))):
+            # One entry per institution/degree; missing fields come back as None
+            entries = islice(
+                zip_longest(degrees, majors, institutions, years),
+                max(len(institutions), len(degrees)),
+            )
+            for degree, major, institution, year in entries:
                 edu_parts = []
-                if i < len(degrees):
-                    edu_parts.append(degrees[i])
-                if i < len(majors) and majors[i]:
-                    edu_parts.append(f"in {majors[i]}")
-                if i < len(institutions):
-                    edu_parts.append(f"from {institutions[i]}")
-                if i < len(years) and years[i] != 'N/A':
-                    edu_parts.append(f"({years[i]})")
+                if degree is not None:
+                    edu_parts.append(degree)
+                if major:
+                    edu_parts.append(f"in {major}")
+                if institution is not None:
+                    edu_parts.append(f"from {institution}")
+                if year is not None and year != 'N/A':
+                    edu_parts.append(f"({year})")
 
                 if edu_parts:
                     sections.append(" ".join(edu_parts))
             sections.append("")
 
         # Experience
-        companies = self._safe_parse_list(row.get('professional_company_names'))
-        positions = self._safe_parse_list(row.get('positions'))
-        start_dates = self._safe_parse_list(row.get('start_dates'))
-        end_dates = self._safe_parse_list(row.get('end_dates'))
-        responsibilities = self._safe_parse_list(row.get('responsibilities'))
+        companies = row.get('professional_company_names') or []
+        positions = row.get('positions') or []
+        start_dates = row.get('start_dates') or []
+        end_dates = row.get('end_dates') or []
+        responsibilities = row.get('responsibilities') or []
 
         if companies or positions:
             sections.append("EXPERIENCE:")
-            for i in range(max(len(companies), len(positions))):
+            entries = islice(
+                zip_longest(positions, companies, start_dates, end_dates, responsibilities),
+                max(len(companies), len(positions)),
+            )
+            for position, company, start, end, responsibility in entries:
                 exp_parts = []
-                if i < len(positions):
-                    exp_parts.append(positions[i])
-                if i < len(companies):
-                    exp_parts.append(f"at {companies[i]}")
-                if i < len(start_dates) and i < len(end_dates):
-                    exp_parts.append(f"({start_dates[i]} - {end_dates[i]})")
+                if position is not None:
+                    exp_parts.append(position)
+                if company is not None:
+                    exp_parts.append(f"at {company}")
+                if start is not None and end is not None:
+                    exp_parts.append(f"({start} - {end})")
 
                 if exp_parts:
                     sections.append(" ".join(exp_parts))
 
-                if i < len(responsibilities) and responsibilities[i]:
-                    sections.append(f"  {responsibilities[i]}")
+                if responsibility:
+                    sections.append(f"  {responsibility}")
 
             sections.append("")
 
         # Languages
-        languages = self._safe_parse_list(row.get('languages'))
+        languages = row.get('languages') or []
         if languages:
             sections.append(f"LANGUAGES:\n{', '.join(languages)}\n")
 
         # Certifications
-        cert_providers = self._safe_parse_list(row.get('certification_providers'))
-        cert_skills = self._safe_parse_list(row.get('certification_skills'))
+        cert_providers = row.get('certification_providers') or []
+        cert_skills = row.get('certification_skills') or []
 
         if cert_providers:
             sections.append("CERTIFICATIONS:")
@@ -165,20 +259,27 @@ class CSVResumeLoader:
         Returns:
             List of resume dictionaries
         """
-        if self.df is None:
-            self.load()
+        if not self._has_rows(max_resumes):
+            self.load(nrows=max_resumes or None)
 
         # Limit number of resumes if specified
         df_subset = self.df.head(max_resumes) if max_resumes else self.df
 
+        # Only materialize the columns actually read per row
+        df_subset = df_subset[[c for c in self.TEXT_COLUMNS if c in df_subset.columns]]
+
         resumes = []
+        columns = list(df_subset.columns)
+
+        # Plain dict rows: much cheaper than the Series built by iterrows()
+        for idx, *values in df_subset.itertuples(index=True, name=None):
+            row = dict(zip(columns, values))
 
-        for idx, row in df_subset.iterrows():
             # Build full resume text
             text = self._build_resume_text(row)
 
             # Extract skills
-            skills = self._safe_parse_list(row.get('skills'))
+            skills = row.get('skills') or []
 
             # Calculate years of experience
             years_exp = self._calculate_experience(row)
@@ -190,13 +291,13 @@ class CSVResumeLoader:
                 "years_experience": years_exp,
                 "career_objective": row.get('career_objective', ''),
                 "education": {
-                    "institutions": self._safe_parse_list(row.get('educational_institution_name')),
-                    "degrees": self._safe_parse_list(row.get('degree_names')),
-                    "majors": self._safe_parse_list(row.get('major_field_of_studies')),
+                    "institutions": row.get('educational_institution_name') or [],
+                    "degrees": row.get('degree_names') or [],
+                    "majors": row.get('major_field_of_studies') or [],
                 },
                 "experience": {
-                    "companies": self._safe_parse_list(row.get('professional_company_names')),
-                    "positions": self._safe_parse_list(row.get('positions')),
+                    "companies": row.get('professional_company_names') or [],
+                    "positions": row.get('positions') or [],
                 },
             }
 
@@ -207,17 +308,17 @@ class CSVResumeLoader:
 
         return resumes
 
-    def _calculate_experience(self, row: pd.Series) -> Optional[int]:
+    def _calculate_experience(self, row: Dict[str, Any]) -> Optional[int]:
         """Calculate years of experience from dates.
 
         Args:
-            row: DataFrame row
+            row: Mapping of column name to value for one row
 
         Returns:
             Years of experience or None
         """
-        start_dates = self._safe_parse_list(row.get('start_dates'))
-        end_dates = self._safe_parse_list(row.get('end_dates'))
+        start_dates = row.get('start_dates') or []
+        end_dates = row.get('end_dates') or []
 
         if not start_dates or not end_dates:
             return None
@@ -225,18 +326,12 @@ class CSVResumeLoader:
         total_years = 0
 
         for start, end in zip(start_dates, end_dates):
-            try:
-                # Extract year from date strings
-                start_year = int(re.search(r'\d{4}', str(start)).group()) if re.search(r'\d{4}', str(start)) else None
-                if 'till date' in str(end).lower() or 'present' in str(end).lower():
-                    end_year = 2026
-                else:
-                    end_year = int(re.search(r'\d{4}', str(end)).group()) if re.search(r'\d{4}', str(end)) else None
-
-                if start_year and end_year:
-                    total_years += (end_year - start_year)
-            except (AttributeError, ValueError):
-                continue
+            # Extract year from date strings (dates repeat heavily across rows)
+            start_year = _start_year(str(start))
+            end_year = _end_year(str(end))
+
+            if start_year and end_year:
+                total_years += (end_year - start_year)
 
         return total_years if total_years > 0 else None
 
@@ -244,6 +339,9 @@ class CSVResumeLoader:
 class CSVJobDescriptionLoader:
     """Load and process job descriptions from CSV."""
 
+    # Columns read when building job description dictionaries
+    TEXT_COLUMNS = ['Job Title', 'job_title', 'Job Description', 'job_description', 'skills_required']
+
     def __init__(self, csv_path: str):
         """Initialize CSV loader.
 
@@ -252,18 +350,36 @@ class CSVJobDescriptionLoader:
         """
         self.csv_path = Path(csv_path)
         self.df = None
+        # Row limit self.df was loaded with (None means every row)
+        self._loaded_nrows = None
 
-    def load(self) -> pd.DataFrame:
+    def load(self, nrows: Optional[int] = None) -> pd.DataFrame:
         """Load CSV file.
 
+        Args:
+            nrows: Only read the first nrows rows (None reads all)
+
         Returns:
             Pandas DataFrame
         """
         print(f"Loading job description CSV from {self.csv_path}...")
-        self.df = pd.read_csv(self.csv_path)
+        self._loaded_nrows = nrows
+        self.df = pd.read_csv(
+            self.csv_path,
+            usecols=lambda col: col in self.TEXT_COLUMNS,
+            nrows=nrows,
+        )
         print(f"  Loaded {len(self.df)} job descriptions")
         return self.df
 
+    def _has_rows(self, max_rows: Optional[int]) -> bool:
+        """Whether the loaded frame covers the first max_rows rows (all if falsy)."""
+        if self.df is None:
+            return False
+        if self._loaded_nrows is None:
+            return True
+        return bool(max_rows) and max_rows <= self._loaded_nrows
+
     def process_to_dict(
         self,
         max_jobs: Optional[int] = None,
@@ -276,15 +392,18 @@ class CSVJobDescriptionLoader:
         Returns:
             List of job description dictionaries
         """
-        if self.df is None:
-            self.load()
+        if not self._has_rows(max_jobs):
+            self.load(nrows=max_jobs or None)
 
         # Limit number of jobs if specified
         df_subset = self.df.head(max_jobs) if max_jobs else self.df
 
         job_descriptions = []
+        columns = list(df_subset.columns)
+
+        for idx, *values in df_subset.itertuples(index=True, name=None):
+            row = dict(zip(columns, values))
 
-        for idx, row in df_subset.iterrows():
             # Get job title and description
             title = row.get('Job Title', row.get('job_title', ''))
             description = row.get('Job Description', row.get('job_description', ''))
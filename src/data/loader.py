@@ -1,16 +1,64 @@
 """Data loading utilities."""
 
-import json
+import mmap
+import orjson
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+import numpy as np
 import pandas as pd
 
+# Same layout as json.dump(indent=2, ensure_ascii=False), from a native encoder
+PRETTY_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _iter_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield records from a JSON array, or one per line for .jsonl files.
+
+    The file is memory-mapped and parsed straight from the mapping, so the
+    OS pages bytes in on demand and no intermediate copy of the file is made.
+    JSON Lines files are decoded one line at a time; a JSON array is decoded
+    as a whole before its first record is yielded.
+    """
+    if path.stat().st_size == 0:
+        # mmap cannot map an empty file; keep the parser's own error/result
+        if path.suffix != ".jsonl":
+            yield from orjson.loads(b"")
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            if path.suffix != ".jsonl":
+                yield from orjson.loads(view)
+                return
+
+            start, size = 0, len(mm)
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = size
+                with view[start:end] as line:
+                    try:
+                        record, blank = orjson.loads(line), False
+                    except orjson.JSONDecodeError:
+                        # Blank lines are skipped; anything else is an error
+                        if bytes(line).strip():
+                            raise
+                        blank = True
+                if not blank:
+                    yield record
+                start = end + 1
+
+
+def _read_records(path: Path) -> List[Dict[str, Any]]:
+    """Read a JSON array, or one JSON object per line for .jsonl files."""
+    return list(_iter_records(path))
+
 
 def load_resumes(file_path: str) -> List[Dict[str, Any]]:
     """Load resumes from JSON file.
 
     Args:
-        file_path: Path to resumes JSON file
+        file_path: Path to resumes JSON (or JSON Lines, .jsonl) file
 
     Returns:
         List of resume dictionaries
@@ -20,17 +68,14 @@ def load_resumes(file_path: str) -> List[Dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"Resume file not found: {file_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        resumes = json.load(f)
-
-    return resumes
+    return _read_records(path)
 
 
 def load_job_descriptions(file_path: str) -> List[Dict[str, Any]]:
     """Load job descriptions from JSON file.
 
     Args:
-        file_path: Path to job descriptions JSON file
+        file_path: Path to job descriptions JSON (or JSON Lines, .jsonl) file
 
     Returns:
         List of job description dictionaries
@@ -40,10 +85,27 @@ def load_job_descriptions(file_path: str) -> List[Dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"Job description file not found: {file_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        job_descriptions = json.load(f)
+    return _read_records(path)
+
 
-    return job_descriptions
+def load_resumes_iter(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily yield resumes from a JSON or JSON Lines file.
+
+    Memory stays flat for .jsonl files, which are decoded line by line;
+    prefer them (see stream_records) for very large corpora.
+
+    Args:
+        file_path: Path to resumes JSON (or JSON Lines, .jsonl) file
+
+    Returns:
+        Iterator over resume dictionaries
+    """
+    path = Path(file_path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Resume file not found: {file_path}")
+
+    return _iter_records(path)
 
 
 def save_resumes(resumes: List[Dict[str, Any]], file_path: str) -> None:
@@ -56,8 +118,7 @@ def save_resumes(resumes: List[Dict[str, Any]], file_path: str) -> None:
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(resumes, f, indent=2, ensure_ascii=False)
+    path.write_bytes(orjson.dumps(resumes, option=PRETTY_JSON_OPTIONS))
 
 
 def save_job_descriptions(job_descriptions: List[Dict[str, Any]], file_path: str) -> None:
@@ -70,8 +131,49 @@ def save_job_descriptions(job_descriptions: List[Dict[str, Any]], file_path: str
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(job_descriptions, f, indent=2, ensure_ascii=False)
+    path.write_bytes(orjson.dumps(job_descriptions, option=PRETTY_JSON_OPTIONS))
+
+
+def stream_records(records: Iterable[Dict[str, Any]], file_path: str) -> int:
+    """Write records to disk one at a time, without building a list.
+
+    Writes compact JSON Lines for .jsonl paths and a compact JSON array
+    otherwise. Output goes to a temporary file that replaces ``file_path``
+    only if at least one record was written, so an empty run never
+    clobbers existing data.
+
+    Args:
+        records: Iterable (e.g. generator) of dictionaries
+        file_path: Output file path
+
+    Returns:
+        Number of records written
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    jsonl = path.suffix == ".jsonl"
+
+    count = 0
+    with open(tmp_path, "wb") as f:
+        if not jsonl:
+            f.write(b"[")
+        for record in records:
+            if count and not jsonl:
+                f.write(b",")
+            f.write(orjson.dumps(record))
+            if jsonl:
+                f.write(b"\n")
+            count += 1
+        if not jsonl:
+            f.write(b"]")
+
+    if count:
+        tmp_path.replace(path)
+    else:
+        tmp_path.unlink()
+
+    return count
 
 
 def create_data_splits(
@@ -89,18 +191,30 @@ def create_data_splits(
     Returns:
         Dictionary with 'dev' and 'test' keys
     """
-    import random
-    random.seed(seed)
+    # Local generator: leaves the global random state untouched
+    order = np.random.default_rng(seed).permutation(len(resumes)).tolist()
 
-    shuffled = resumes.copy()
-    random.shuffle(shuffled)
-
-    split_idx = int(len(shuffled) * dev_ratio)
+    split_idx = int(len(resumes) * dev_ratio)
 
     return {
-        "dev": shuffled[:split_idx],
-        "test": shuffled[split_idx:],
+        "dev": [resumes[i] for i in order[:split_idx]],
+        "test": [resumes[i] for i in order[split_idx:]],
+    }
+
+
+def _read_label_csv(path: Path) -> pd.DataFrame:
+    """Read the label columns, with Arrow's multi-threaded reader if available.
+
+    Ids are read as strings so CSV labels key the same way as JSON labels.
+    """
+    kwargs = {
+        "usecols": ["resume_id", "job_id", "relevance"],
+        "dtype": {"resume_id": str, "job_id": str, "relevance": "float64"},
     }
+    try:
+        return pd.read_csv(path, engine="pyarrow", **kwargs)
+    except ImportError:
+        return pd.read_csv(path, **kwargs)
 
 
 def load_weak_labels(file_path: str) -> Dict[str, Dict[str, float]]:
@@ -118,19 +232,15 @@ def load_weak_labels(file_path: str) -> Dict[str, Dict[str, float]]:
         return {}
 
     if path.suffix == ".json":
-        with open(path, "r") as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes())
     elif path.suffix == ".csv":
-        df = pd.read_csv(path)
+        df = _read_label_csv(path)
         labels = {}
-        for _, row in df.iterrows():
-            resume_id = row["resume_id"]
-            job_id = row["job_id"]
-            score = row["relevance"]
-
-            if resume_id not in labels:
-                labels[resume_id] = {}
-            labels[resume_id][job_id] = score
+        # Whole columns are converted to Python lists once; no per-row Series
+        for resume_id, job_id, score in zip(
+            df["resume_id"].tolist(), df["job_id"].tolist(), df["relevance"].tolist()
+        ):
+            labels.setdefault(resume_id, {})[job_id] = score
 
         return labels
     else:
@@ -3,24 +3,106 @@
 Extracts text from PDFs and structures the content.
 """
 
+import hashlib
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import PyPDF2
 import pdfplumber
+import pymupdf
+
+
+# Common skill keywords (this is simplified - expand as needed)
+SKILL_KEYWORDS = (
+    "python",
+    "java",
+    "javascript",
+    "c++",
+    "sql",
+    "machine learning",
+    "deep learning",
+    "nlp",
+    "data analysis",
+    "project management",
+    "leadership",
+    "communication",
+    "agile",
+    "scrum",
+    "aws",
+    "azure",
+    "docker",
+    "kubernetes",
+    "git",
+    "react",
+    "node.js",
+    "tensorflow",
+    "pytorch",
+)
+
+
+# Section header keyword -> section name
+SECTION_KEYWORDS = {
+    "summary": "summary",
+    "objective": "summary",
+    "profile": "summary",
+    "about": "summary",
+    "experience": "experience",
+    "employment": "experience",
+    "work history": "experience",
+    "education": "education",
+    "academic": "education",
+    "qualifications": "education",
+    "skills": "skills",
+    "technical skills": "skills",
+    "competencies": "skills",
+}
+
+# A line starting (after whitespace) with a section keyword, in any case.
+# Each keyword has its own group, so the section is found from the group
+# index (lowercasing the match does not always give back the keyword,
+# e.g. "ſkills" matches "skills" case-insensitively)
+SECTION_HEADER_PATTERN = re.compile(
+    r"^[^\S\n]*(?:" + "|".join(f"({re.escape(k)})" for k in SECTION_KEYWORDS) + r")[^\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Section name of each SECTION_HEADER_PATTERN group, in group order
+SECTION_HEADER_GROUPS = tuple(SECTION_KEYWORDS.values())
+
+
+# Experience mentions; scanned separately because they may overlap
+# (e.g. "2019 - 2023 years" contains both)
+YEARS_MENTION_PATTERN = re.compile(r"(\d+)\+?\s*years?", re.IGNORECASE)
+DATE_RANGE_PATTERN = re.compile(r"(\d{4})\s*-\s*(\d{4}|present|current)", re.IGNORECASE)
 
 
 class ResumeParser:
     """Parse resume PDFs and extract structured information."""
 
-    def __init__(self, use_pdfplumber: bool = True):
+    def __init__(
+        self,
+        use_pdfplumber: bool = True,
+        use_pymupdf: Optional[bool] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         """Initialize parser.
 
         Args:
             use_pdfplumber: If True, use pdfplumber (better quality).
-                           If False, use PyPDF2 (faster).
+                           If False, use PyPDF2 (faster). Also used as the
+                           fallback when PyMuPDF extracts no text.
+            use_pymupdf: If True, use PyMuPDF for plain-text extraction
+                         (fastest; takes precedence over use_pdfplumber).
+                         Defaults to use_pdfplumber, so use_pdfplumber=False
+                         alone still selects PyPDF2.
+            cache_dir: Directory of extracted texts keyed by PDF content hash
+                       (None disables caching)
         """
         self.use_pdfplumber = use_pdfplumber
+        self.use_pymupdf = use_pdfplumber if use_pymupdf is None else use_pymupdf
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def parse_pdf(self, pdf_path: Path) -> str:
         """Extract text from PDF file.
@@ -31,11 +113,72 @@ class ResumeParser:
         Returns:
             Extracted text content
         """
-        if self.use_pdfplumber:
+        if self.cache_dir is None:
+            return self._extract_text(pdf_path)
+
+        # Key on the PDF bytes and the backends, which determine the output
+        digest = hashlib.blake2b(Path(pdf_path).read_bytes(), digest_size=16).hexdigest()
+        backends = f"{int(self.use_pymupdf)}{int(self.use_pdfplumber)}"
+        cache_path = self.cache_dir / f"{digest}_{backends}.txt"
+        if cache_path.exists():
+            return cache_path.read_bytes().decode("utf-8")
+
+        text = self._extract_text(pdf_path)
+
+        # Write atomically so a concurrent worker never reads a partial file
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(text.encode("utf-8"))
+        os.replace(tmp_path, cache_path)
+
+        return text
+
+    def _extract_text(self, pdf_path: Path) -> str:
+        """Extract text with the configured backend (uncached)."""
+        if self.use_pymupdf:
+            text = self._parse_with_pymupdf(pdf_path)
+            if text.strip() or not self.use_pdfplumber:
+                return text
+            # Nothing extracted (e.g. text laid out in tables); retry with
+            # pdfplumber's layout analysis
+            return self._parse_with_pdfplumber(pdf_path)
+        elif self.use_pdfplumber:
             return self._parse_with_pdfplumber(pdf_path)
         else:
             return self._parse_with_pypdf2(pdf_path)
 
+    def parse_many(self, pdf_paths: List[Path], workers: Optional[int] = None) -> List[str]:
+        """Extract text from many PDF files in parallel worker processes.
+
+        Args:
+            pdf_paths: Paths to PDF files
+            workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            Extracted text content, in the order of pdf_paths
+        """
+        workers = min(workers or os.cpu_count() or 1, len(pdf_paths))
+        if workers <= 1:
+            return [self.parse_pdf(path) for path in pdf_paths]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.parse_pdf, pdf_paths, chunksize=4))
+
+    def _parse_with_pymupdf(self, pdf_path: Path) -> str:
+        """Extract text using PyMuPDF (fastest, no layout objects)."""
+        text_content = []
+
+        try:
+            with pymupdf.open(pdf_path) as pdf:
+                for page in pdf:
+                    text = page.get_text("text")
+                    if text:
+                        text_content.append(text)
+        except Exception as e:
+            raise ValueError(f"Error parsing PDF {pdf_path}: {e}")
+
+        return "\n\n".join(text_content)
+
     def _parse_with_pdfplumber(self, pdf_path: Path) -> str:
         """Extract text using pdfplumber (better quality)."""
         text_content = []
@@ -84,29 +227,20 @@ class ResumeParser:
             "other": "",
         }
 
-        # Common section headers
-        section_patterns = {
-            "summary": r"(?i)(summary|objective|profile|about)",
-            "experience": r"(?i)(experience|employment|work history)",
-            "education": r"(?i)(education|academic|qualifications)",
-            "skills": r"(?i)(skills|technical skills|competencies)",
-        }
-
-        # Split text by common section markers
-        lines = text.split("\n")
+        # Find every header line in one scan; the text between consecutive
+        # headers belongs to the earlier header's section
         current_section = "other"
+        position = 0
 
-        for line in lines:
-            line_lower = line.lower().strip()
+        for match in SECTION_HEADER_PATTERN.finditer(text):
+            if len(match.group().strip()) >= 50:
+                continue
 
-            # Check if line is a section header
-            for section_name, pattern in section_patterns.items():
-                if re.match(pattern, line_lower) and len(line_lower) < 50:
-                    current_section = section_name
-                    break
-            else:
-                # Add line to current section
-                sections[current_section] += line + "\n"
+            sections[current_section] += text[position:match.start()]
+            current_section = SECTION_HEADER_GROUPS[match.lastindex - 1]
+            position = match.end() + 1  # Skip the header's newline
+
+        sections[current_section] += text[position:]
 
         return {k: v.strip() for k, v in sections.items() if v.strip()}
 
@@ -119,41 +253,20 @@ class ResumeParser:
         Returns:
             List of extracted skills
         """
-        # Common skill keywords (this is simplified - expand as needed)
-        skill_keywords = [
-            "python",
-            "java",
-            "javascript",
-            "c++",
-            "sql",
-            "machine learning",
-            "deep learning",
-            "nlp",
-            "data analysis",
-            "project management",
-            "leadership",
-            "communication",
-            "agile",
-            "scrum",
-            "aws",
-            "azure",
-            "docker",
-            "kubernetes",
-            "git",
-            "react",
-            "node.js",
-            "tensorflow",
-            "pytorch",
-        ]
-
-        text_lower = text.lower()
-        found_skills = []
-
-        for skill in skill_keywords:
-            if skill in text_lower:
-                found_skills.append(skill)
-
-        return found_skills
+        return self.extract_skills_prelowered(text.lower())
+
+    def extract_skills_prelowered(self, text_lower: str) -> List[str]:
+        """Extract skills from resume text that is already lowercased.
+
+        Lets callers that hold a lowercased copy skip a second lower() pass.
+
+        Args:
+            text_lower: Lowercased resume text
+
+        Returns:
+            List of extracted skills
+        """
+        return [skill for skill in SKILL_KEYWORDS if skill in text_lower]
 
     def extract_years_experience(self, text: str) -> Optional[int]:
         """Estimate years of experience from resume.
@@ -164,51 +277,38 @@ class ResumeParser:
         Returns:
             Estimated years of experience, or None if not found
         """
-        # Look for patterns like "5 years", "5+ years", "2019-2023"
-        year_patterns = [
-            r"(\d+)\+?\s*years?",
-            r"(\d{4})\s*-\s*(\d{4}|present|current)",
-        ]
-
-        years = []
-
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    if len(match) == 2:
-                        # Date range
-                        try:
-                            start = int(match[0])
-                            end = 2026 if match[1].lower() in ["present", "current"] else int(match[1])
-                            years.append(end - start)
-                        except ValueError:
-                            continue
-                else:
-                    # Direct year mention
-                    try:
-                        years.append(int(match))
-                    except ValueError:
-                        continue
+        # Direct mentions like "5 years" or "5+ years"
+        years = [int(count) for count in YEARS_MENTION_PATTERN.findall(text)]
+
+        # Date ranges like "2019-2023" or "2019 - present"
+        for start, end in DATE_RANGE_PATTERN.findall(text):
+            end_year = 2026 if end.lower() in ("present", "current") else int(end)
+            years.append(end_year - int(start))
 
         return max(years) if years else None
 
 
+# Shared default for JobDescriptionParser.parse; ResumeParser holds only
+# configuration, so one instance is safe to reuse across calls and threads
+_DEFAULT_PDF_PARSER = ResumeParser()
+
+
 class JobDescriptionParser:
     """Parse job descriptions from text files or PDFs."""
 
     @staticmethod
-    def parse(file_path: Path) -> str:
+    def parse(file_path: Path, pdf_parser: Optional[ResumeParser] = None) -> str:
         """Parse job description from file.
 
         Args:
             file_path: Path to job description file
+            pdf_parser: Parser for PDF files (defaults to a shared ResumeParser())
 
         Returns:
             Job description text
         """
         if file_path.suffix.lower() == ".pdf":
-            parser = ResumeParser()
+            parser = pdf_parser or _DEFAULT_PDF_PARSER
             return parser.parse_pdf(file_path)
         else:
             # Plain text file
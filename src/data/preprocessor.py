@@ -4,6 +4,36 @@ import re
 import string
 from typing import List
 
+# Compiled once at import; these run over every document in the corpus
+WHITESPACE_PATTERN = re.compile(r"\s+")
+SPECIAL_CHARS_PATTERN = re.compile(r"[^\w\s.,!?;:()\-]")
+# Deletion table for the ASCII characters SPECIAL_CHARS_PATTERN removes;
+# str.translate is a plain C loop, used whenever the text is pure ASCII
+SPECIAL_CHARS_TABLE = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if SPECIAL_CHARS_PATTERN.match(chr(i)))
+)
+REPEATED_PERIODS_PATTERN = re.compile(r"\.{2,}")
+REPEATED_SPACES_PATTERN = re.compile(r" +")
+REPEATED_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+URL_PATTERN = re.compile(
+    r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+)
+WWW_PATTERN = re.compile(r"www\.[^\s]+")
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+PHONE_PATTERNS = [
+    re.compile(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b"),
+    re.compile(r"\(\d{3}\)\s*\d{3}[-.]?\d{4}"),
+    re.compile(r"\+\d{1,3}[-.]?\d{3}[-.]?\d{3}[-.]?\d{4}"),
+]
+TOKEN_PATTERN = re.compile(r"\b\w+\b")
+
+# Basic English stopwords
+DEFAULT_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for",
+    "from", "has", "he", "in", "is", "it", "its", "of", "on",
+    "that", "the", "to", "was", "will", "with", "this",
+})
+
 
 class TextPreprocessor:
     """Clean and normalize text for processing."""
@@ -28,19 +58,22 @@ class TextPreprocessor:
             Cleaned text
         """
         # Remove excessive whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = WHITESPACE_PATTERN.sub(" ", text)
 
         # Remove special characters if requested
         if self.remove_special_chars:
             # Keep alphanumeric, spaces, and basic punctuation
-            text = re.sub(r"[^\w\s.,!?;:()\-]", "", text)
+            if text.isascii():
+                text = text.translate(SPECIAL_CHARS_TABLE)
+            else:
+                text = SPECIAL_CHARS_PATTERN.sub("", text)
 
         # Normalize quotes
         text = text.replace('"', '"').replace('"', '"')
         text = text.replace("'", "'").replace("'", "'")
 
         # Remove multiple periods
-        text = re.sub(r"\.{2,}", ".", text)
+        text = REPEATED_PERIODS_PATTERN.sub(".", text)
 
         # Convert to lowercase if requested
         if self.lowercase:
@@ -61,10 +94,10 @@ class TextPreprocessor:
         text = text.replace("\t", " ")
 
         # Replace multiple spaces with single space
-        text = re.sub(r" +", " ", text)
+        text = REPEATED_SPACES_PATTERN.sub(" ", text)
 
         # Replace multiple newlines with double newline
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = REPEATED_NEWLINES_PATTERN.sub("\n\n", text)
 
         return text.strip()
 
@@ -77,11 +110,10 @@ class TextPreprocessor:
         Returns:
             Text with URLs removed
         """
-        url_pattern = r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-        text = re.sub(url_pattern, "", text)
+        text = URL_PATTERN.sub("", text)
 
         # Also remove www. patterns
-        text = re.sub(r"www\.[^\s]+", "", text)
+        text = WWW_PATTERN.sub("", text)
 
         return text
 
@@ -94,8 +126,7 @@ class TextPreprocessor:
         Returns:
             Text with emails removed
         """
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        return re.sub(email_pattern, "", text)
+        return EMAIL_PATTERN.sub("", text)
 
     def remove_phone_numbers(self, text: str) -> str:
         """Remove phone numbers from text.
@@ -107,14 +138,8 @@ class TextPreprocessor:
             Text with phone numbers removed
         """
         # Match various phone formats
-        phone_patterns = [
-            r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",
-            r"\(\d{3}\)\s*\d{3}[-.]?\d{4}",
-            r"\+\d{1,3}[-.]?\d{3}[-.]?\d{3}[-.]?\d{4}",
-        ]
-
-        for pattern in phone_patterns:
-            text = re.sub(pattern, "", text)
+        for pattern in PHONE_PATTERNS:
+            text = pattern.sub("", text)
 
         return text
 
@@ -128,7 +153,7 @@ class TextPreprocessor:
             List of tokens
         """
         # Split on whitespace and punctuation
-        tokens = re.findall(r"\b\w+\b", text.lower())
+        tokens = TOKEN_PATTERN.findall(text.lower())
         return tokens
 
     def remove_stopwords(self, tokens: List[str], stopwords: List[str] = None) -> List[str]:
@@ -142,11 +167,9 @@ class TextPreprocessor:
             Filtered tokens
         """
         if stopwords is None:
-            # Basic English stopwords
-            stopwords = {
-                "a", "an", "and", "are", "as", "at", "be", "by", "for",
-                "from", "has", "he", "in", "is", "it", "its", "of", "on",
-                "that", "the", "to", "was", "will", "with", "the", "this",
-            }
+            stopwords = DEFAULT_STOPWORDS
+        elif not isinstance(stopwords, (set, frozenset)):
+            # One hashing pass instead of a linear list scan per token
+            stopwords = frozenset(stopwords)
 
         return [token for token in tokens if token.lower() not in stopwords]
@@ -3,8 +3,31 @@
 Removes or masks sensitive personal information from resumes.
 """
 
+import os
 import re
-from typing import List, Dict, Pattern
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Pattern, Tuple
+
+# The regex module matches like re for these patterns but is faster on them
+# and releases the GIL while scanning str objects, so redact_many() scales
+# across threads
+import regex
+
+# A resume header line consisting only of capitalized words (likely a name)
+NAME_LINE_PATTERN = regex.compile(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$")
+
+# Contact redaction passes in order of specificity: (pattern name, suffix,
+# substring the text must contain for the pattern to possibly match).
+# Kept as separate passes: a single named-group alternation gives the same
+# output on the CSV corpus but is several times slower, since the regex
+# module's backtracking engine tries every alternative at every position.
+CONTACT_PASSES = (
+    ("ssn", "SSN", None),
+    ("email", "EMAIL", "@"),
+    ("phone", "PHONE", None),
+    ("address", "ADDRESS", None),
+    ("zip", "ZIP", None),
+)
 
 
 class PIIRedactor:
@@ -23,33 +46,39 @@ class PIIRedactor:
         # PII patterns
         self.patterns = self._compile_patterns()
 
+        # Specialize to the configuration once instead of re-checking per call
+        self._contact_passes: List[Tuple[Pattern, str, Optional[str]]] = (
+            [(self.patterns[name], suffix, guard) for name, suffix, guard in CONTACT_PASSES]
+            if redact_contact else []
+        )
+
     def _compile_patterns(self) -> Dict[str, Pattern]:
         """Compile regex patterns for PII detection."""
         patterns = {}
 
         # Email
-        patterns["email"] = re.compile(
+        patterns["email"] = regex.compile(
             r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
         )
 
         # Phone numbers (various formats)
-        patterns["phone"] = re.compile(
+        patterns["phone"] = regex.compile(
             r"\b(?:\+\d{1,3}[-.]?)?"  # Optional country code
             r"(?:\(\d{3}\)|\d{3})[-.]?"  # Area code
             r"\d{3}[-.]?\d{4}\b"  # Number
         )
 
         # SSN (XXX-XX-XXXX)
-        patterns["ssn"] = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
+        patterns["ssn"] = regex.compile(r"\b\d{3}-\d{2}-\d{4}\b")
 
         # Street addresses (simplified)
-        patterns["address"] = re.compile(
+        patterns["address"] = regex.compile(
             r"\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd)\b",
-            re.IGNORECASE,
+            regex.IGNORECASE,
         )
 
         # ZIP codes
-        patterns["zip"] = re.compile(r"\b\d{5}(?:-\d{4})?\b")
+        patterns["zip"] = regex.compile(r"\b\d{5}(?:-\d{4})?\b")
 
         return patterns
 
@@ -65,19 +94,39 @@ class PIIRedactor:
         """
         redacted_text = text
 
-        if self.redact_contact:
-            # Redact in order of specificity
-            redacted_text = self.patterns["ssn"].sub(f"{placeholder}_SSN", redacted_text)
-            redacted_text = self.patterns["email"].sub(f"{placeholder}_EMAIL", redacted_text)
-            redacted_text = self.patterns["phone"].sub(f"{placeholder}_PHONE", redacted_text)
-            redacted_text = self.patterns["address"].sub(f"{placeholder}_ADDRESS", redacted_text)
-            redacted_text = self.patterns["zip"].sub(f"{placeholder}_ZIP", redacted_text)
+        for pattern, suffix, guard in self._contact_passes:
+            if guard is not None and guard not in redacted_text:
+                continue
+            redacted_text = pattern.sub(f"{placeholder}_{suffix}", redacted_text)
 
         if self.redact_names:
             redacted_text = self._redact_names(redacted_text, placeholder)
 
         return redacted_text
 
+    def redact_many(
+        self,
+        texts: List[str],
+        placeholder: str = "[REDACTED]",
+        workers: Optional[int] = None,
+    ) -> List[str]:
+        """Redact PII from many texts using a thread pool.
+
+        Args:
+            texts: Input texts
+            placeholder: Replacement text for redacted information
+            workers: Number of threads (defaults to the CPU count, at most 8)
+
+        Returns:
+            Redacted texts, in the order of texts
+        """
+        workers = min(workers or min(os.cpu_count() or 1, 8), len(texts))
+        if workers <= 1:
+            return [self.redact(text, placeholder) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda text: self.redact(text, placeholder), texts))
+
     def _redact_names(self, text: str, placeholder: str) -> str:
         """Redact person names from text.
 
@@ -95,20 +144,16 @@ class PIIRedactor:
         # For now, just redact capitalized words at start of lines
         # (likely to be names in resume headers)
 
-        lines = text.split("\n")
-        redacted_lines = []
-
-        for i, line in enumerate(lines):
-            # First few lines often contain name
-            if i < 3 and line.strip():
-                # Check if line looks like a name (capitalized words, no numbers)
-                if re.match(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$", line.strip()):
-                    redacted_lines.append(f"{placeholder}_NAME")
-                    continue
+        # Only the first few lines often contain the name; split those off
+        # and leave the rest of the document as one untouched tail
+        lines = text.split("\n", 3)
 
-            redacted_lines.append(line)
+        for i, line in enumerate(lines[:3]):
+            # Check if line looks like a name (capitalized words, no numbers)
+            if NAME_LINE_PATTERN.match(line.strip()):
+                lines[i] = f"{placeholder}_NAME"
 
-        return "\n".join(redacted_lines)
+        return "\n".join(lines)
 
     def anonymize_names(self, text: str, name_map: Dict[str, str] = None) -> str:
         """Replace names with pseudonyms.
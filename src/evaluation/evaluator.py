@@ -41,7 +41,10 @@ class ModelEvaluator:
                   "Evaluation metrics require heuristic or weak labels.")
             return {}
 
-        all_metrics = []
+        # Running per-metric sums; memory stays constant in the number of jobs
+        metric_names = None
+        metric_sums = None
+        num_jobs = 0
 
         # Evaluate on each job description
         for job_data in test_data:
@@ -52,28 +55,34 @@ class ModelEvaluator:
             rankings = model.rank(job_text, top_k=None)
 
             # Get true labels if available
-            if job_id in weak_labels:
-                y_true = []
-                y_pred = []
-
-                for resume_id, pred_score in rankings:
-                    if resume_id in weak_labels[job_id]:
-                        y_true.append(weak_labels[job_id][resume_id])
-                        y_pred.append(pred_score)
+            if job_id in weak_labels and rankings:
+                labels_map = weak_labels[job_id]
+                resume_ids, pred_scores = zip(*rankings)
+
+                # Unlabeled resumes become NaN and are masked out in one step
+                trues = np.fromiter(
+                    (labels_map.get(resume_id, np.nan) for resume_id in resume_ids),
+                    dtype=np.float64,
+                    count=len(resume_ids),
+                )
+                labeled = ~np.isnan(trues)
+                y_true = trues[labeled]
+                y_pred = np.asarray(pred_scores, dtype=np.float64)[labeled]
 
                 # Compute metrics
-                if y_true:
+                if y_true.size:
                     metrics = self.metrics_calculator.compute_all(y_true, y_pred)
-                    all_metrics.append(metrics)
+                    if metric_names is None:
+                        metric_names = list(metrics.keys())
+                        metric_sums = np.zeros(len(metric_names), dtype=np.float64)
+                    metric_sums += [metrics[name] for name in metric_names]
+                    num_jobs += 1
 
         # Average metrics across all jobs
-        if not all_metrics:
+        if not num_jobs:
             return {}
 
-        avg_metrics = {}
-        for metric_name in all_metrics[0].keys():
-            values = [m[metric_name] for m in all_metrics]
-            avg_metrics[metric_name] = np.mean(values)
+        avg_metrics = dict(zip(metric_names, metric_sums / num_jobs))
 
         # Store results
         self.results[model_name] = avg_metrics
@@ -9,8 +9,73 @@ Implements:
 
 from typing import List, Dict, Any, Tuple
 import numpy as np
-from scipy.stats import spearmanr
-from sklearn.metrics import ndcg_score
+from scipy.stats import rankdata
+
+# Position discounts 1/log2(i + 2), extended on demand by _discounts()
+_DISCOUNTS = 1 / (np.log(np.arange(1024) + 2) / np.log(2))
+
+
+def _discounts(n: int) -> np.ndarray:
+    """Return the first n position discounts, growing the cache if needed.
+
+    Args:
+        n: Number of ranked positions
+
+    Returns:
+        Read-only array of discounts
+    """
+    global _DISCOUNTS
+    if n > _DISCOUNTS.size:
+        size = max(n, 2 * _DISCOUNTS.size)
+        _DISCOUNTS = 1 / (np.log(np.arange(size) + 2) / np.log(2))
+    return _DISCOUNTS[:n]
+
+
+def _ndcg(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """NDCG of a whole list, matching sklearn.metrics.ndcg_score.
+
+    Gains are linear and tied predictions share their average gain; without
+    ties this reduces to a dot product in prediction order. Inputs
+    sklearn rejects (fewer than two items, negative relevance, non-finite
+    values) score 0.0.
+
+    Args:
+        y_true: True relevance scores
+        y_pred: Predicted scores
+
+    Returns:
+        NDCG score
+    """
+    if (
+        y_true.size < 2
+        or y_true.min() < 0
+        or not np.isfinite(y_true).all()
+        or not np.isfinite(y_pred).all()
+    ):
+        return 0.0
+
+    discount = _discounts(y_true.size)
+
+    # Ideal DCG: true relevance in descending order
+    ideal_dcg = discount.dot(np.sort(y_true)[::-1])
+    if ideal_dcg == 0:
+        return 0.0
+
+    order = np.argsort(-y_pred)
+    sorted_pred = y_pred[order]
+    if (sorted_pred[1:] != sorted_pred[:-1]).all():
+        return float(discount.dot(y_true[order]) / ideal_dcg)
+
+    # DCG with tied predictions averaged over their positions
+    _, group_of, group_sizes = np.unique(-y_pred, return_inverse=True, return_counts=True)
+    group_gains = np.zeros(len(group_sizes))
+    np.add.at(group_gains, group_of, y_true)
+    group_gains /= group_sizes
+    discount_cumsum = np.cumsum(discount)[np.cumsum(group_sizes) - 1]
+    group_discounts = np.diff(discount_cumsum, prepend=0.0)
+    dcg = (group_gains * group_discounts).sum()
+
+    return float(dcg / ideal_dcg)
 
 
 def calculate_ndcg(
@@ -28,25 +93,18 @@ def calculate_ndcg(
     Returns:
         NDCG score
     """
+    y_true = np.asarray(y_true, dtype=np.float64)
+    y_pred = np.asarray(y_pred, dtype=np.float64)
+
     if k is not None:
         y_true = y_true[:k]
         y_pred = y_pred[:k]
 
     # Handle case with no relevant items
-    if not any(y_true):
+    if not y_true.any():
         return 0.0
 
-    # scikit-learn expects 2D arrays
-    y_true_array = np.array([y_true])
-    y_pred_array = np.array([y_pred])
-
-    try:
-        score = ndcg_score(y_true_array, y_pred_array)
-    except ValueError:
-        # Handle edge cases
-        return 0.0
-
-    return float(score)
+    return _ndcg(y_true, y_pred)
 
 
 def calculate_precision_at_k(
@@ -66,13 +124,18 @@ def calculate_precision_at_k(
     Returns:
         Precision@k score
     """
-    # Get top-k predictions
-    top_k_indices = np.argsort(y_pred)[-k:][::-1]
+    y_pred_array = np.asarray(y_pred, dtype=np.float64)
+    top_n = min(k, y_pred_array.size)
+    if top_n == 0:
+        return 0.0
+
+    # Select the top-k set in O(n); precision does not depend on its order
+    top_k_indices = np.argpartition(y_pred_array, -top_n)[-top_n:]
 
     # Count relevant items in top-k
-    relevant_count = sum(1 for idx in top_k_indices if y_true[idx] >= relevance_threshold)
+    relevant_count = np.count_nonzero(np.asarray(y_true)[top_k_indices] >= relevance_threshold)
 
-    return relevant_count / k
+    return int(relevant_count) / k
 
 
 def calculate_mrr(
@@ -90,15 +153,50 @@ def calculate_mrr(
     Returns:
         MRR score
     """
-    # Get ranking by predicted scores
-    ranked_indices = np.argsort(y_pred)[::-1]
+    y_true_array = np.asarray(y_true, dtype=np.float64)
+    y_pred_array = np.asarray(y_pred, dtype=np.float64)
+
+    relevant = y_true_array >= relevance_threshold
+    if not relevant.any():
+        return 0.0
 
-    # Find first relevant item
-    for rank, idx in enumerate(ranked_indices, 1):
-        if y_true[idx] >= relevance_threshold:
-            return 1.0 / rank
+    # The first relevant item in descending score order is the best-scored
+    # one. When no other item shares its score (and there are no NaNs, which
+    # sort first), its rank is one plus the number of items scored higher.
+    best_relevant_score = y_pred_array[relevant].max()
+    if (
+        np.count_nonzero(y_pred_array == best_relevant_score) == 1
+        and not np.isnan(y_pred_array).any()
+    ):
+        return 1.0 / (1 + np.count_nonzero(y_pred_array > best_relevant_score))
 
-    return 0.0
+    # Ties at that score are ordered as by a reversed argsort, rather than in
+    # favor of relevant items. numpy's default sort is not stable, so that
+    # order is not a function of positions alone and needs the sort itself.
+    ranked_relevant = relevant[np.argsort(y_pred_array)[::-1]]
+    rank = 1 + int(np.argmax(ranked_relevant))
+
+    return 1.0 / rank
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    """Rank values, averaging the ranks of ties like scipy's rankdata.
+
+    Args:
+        values: 1-D array of values
+
+    Returns:
+        Float ranks starting at 1
+    """
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    if (sorted_values[1:] == sorted_values[:-1]).any():
+        return rankdata(values)
+
+    # Distinct values: the rank is just the position in sorted order
+    ranks = np.empty(values.size, dtype=np.float64)
+    ranks[order] = np.arange(1, values.size + 1)
+    return ranks
 
 
 def calculate_spearman(
@@ -117,9 +215,22 @@ def calculate_spearman(
     if len(ranking1) != len(ranking2):
         raise ValueError("Rankings must have same length")
 
-    correlation, _ = spearmanr(ranking1, ranking2)
+    x = np.asarray(ranking1, dtype=np.float64)
+    y = np.asarray(ranking2, dtype=np.float64)
+    if x.size < 2 or np.isnan(x).any() or np.isnan(y).any():
+        return float("nan")
 
-    return float(correlation)
+    # Pearson correlation of the ranks; the p-value is never used
+    x_ranks = _ranks(x)
+    y_ranks = _ranks(y)
+    x_ranks -= x_ranks.mean()
+    y_ranks -= y_ranks.mean()
+    denominator = np.sqrt(x_ranks.dot(x_ranks) * y_ranks.dot(y_ranks))
+    if denominator == 0:
+        # Constant input: correlation is undefined
+        return float("nan")
+
+    return float(np.clip(x_ranks.dot(y_ranks) / denominator, -1.0, 1.0))
 
 
 class RankingMetrics:
@@ -149,6 +260,10 @@ class RankingMetrics:
         Returns:
             Dictionary of metric_name -> score
         """
+        # Convert once; the per-metric functions then work on array views
+        y_true = np.asarray(y_true, dtype=np.float64)
+        y_pred = np.asarray(y_pred, dtype=np.float64)
+
         metrics = {}
 
         # NDCG@k for each k
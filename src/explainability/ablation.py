@@ -3,20 +3,79 @@
 Explains rankings by removing sections and measuring impact.
 """
 
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 import re
 
+from ..utils.hashing import text_digest
+
+
+# Common section patterns: a header keyword up to the next blank line
+SECTION_PATTERNS = {
+    name: re.compile(rf"({keywords})(.*?)(?=\n\n|\Z)", re.IGNORECASE | re.DOTALL)
+    for name, keywords in {
+        "skills": "skills|technical skills|competencies",
+        "experience": "experience|employment|work history",
+        "education": "education|academic",
+        "summary": "summary|objective|profile",
+    }.items()
+}
+
 
 class AblationExplainer:
     """Explain rankings using ablation studies."""
 
-    def __init__(self, ranker: Any):
+    def __init__(self, ranker: Any, baseline_cache_size: int = 1024):
         """Initialize ablation explainer.
 
         Args:
             ranker: Ranking model with score() method
+            baseline_cache_size: Maximum number of baseline scores kept for reuse
         """
         self.ranker = ranker
+        self.baseline_cache_size = baseline_cache_size
+        # (resume id, text digest, job digest) -> unablated score, least recent first
+        self._baseline_cache: OrderedDict = OrderedDict()
+
+    def _baseline_score(self, resume: Dict[str, Any], job_description: str) -> float:
+        """Score the unmodified resume, reusing earlier results for the same input.
+
+        Args:
+            resume: Resume dictionary with 'text' key
+            job_description: Job description text
+
+        Returns:
+            Ranker score of the resume
+        """
+        key = (resume.get("id"), text_digest(resume["text"]), text_digest(job_description))
+        if key in self._baseline_cache:
+            self._baseline_cache.move_to_end(key)
+            return self._baseline_cache[key]
+
+        score = self.ranker.score(resume, job_description)
+
+        if self.baseline_cache_size > 0:
+            self._baseline_cache[key] = score
+            if len(self._baseline_cache) > self.baseline_cache_size:
+                self._baseline_cache.popitem(last=False)
+
+        return score
+
+    def _find_section(self, text: str, section_name: str) -> Optional[re.Match]:
+        """Locate a specific section in resume text.
+
+        Args:
+            text: Resume text
+            section_name: Section to locate
+
+        Returns:
+            Match spanning the section, or None if it is absent
+        """
+        pattern = SECTION_PATTERNS.get(section_name)
+        if not pattern:
+            return None
+
+        return pattern.search(text)
 
     def _extract_section(self, text: str, section_name: str) -> str:
         """Extract a specific section from resume text.
@@ -28,21 +87,27 @@ class AblationExplainer:
         Returns:
             Section text
         """
-        # Common section patterns
-        patterns = {
-            "skills": r"(?i)(skills|technical skills|competencies)(.*?)(?=\n\n|\Z)",
-            "experience": r"(?i)(experience|employment|work history)(.*?)(?=\n\n|\Z)",
-            "education": r"(?i)(education|academic)(.*?)(?=\n\n|\Z)",
-            "summary": r"(?i)(summary|objective|profile)(.*?)(?=\n\n|\Z)",
-        }
-
-        pattern = patterns.get(section_name)
-        if not pattern:
-            return ""
-
-        match = re.search(pattern, text, re.DOTALL)
+        match = self._find_section(text, section_name)
         return match.group(0) if match else ""
 
+    @staticmethod
+    def _cut_span(text: str, match: Optional[re.Match]) -> str:
+        """Remove exactly the matched span from text.
+
+        Args:
+            text: Text the match was found in
+            match: Match to cut out, or None
+
+        Returns:
+            Text with the span removed
+        """
+        if not match:
+            return text
+
+        # Slicing on the span removes only this occurrence; str.replace would
+        # rescan the text and also drop identical content elsewhere
+        return (text[: match.start()] + text[match.end() :]).strip()
+
     def _remove_section(self, text: str, section_name: str) -> str:
         """Remove a section from resume text.
 
@@ -53,12 +118,7 @@ class AblationExplainer:
         Returns:
             Text with section removed
         """
-        section_text = self._extract_section(text, section_name)
-
-        if section_text:
-            return text.replace(section_text, "").strip()
-
-        return text
+        return self._cut_span(text, self._find_section(text, section_name))
 
     def explain(
         self,
@@ -80,13 +140,25 @@ class AblationExplainer:
             sections = ["skills", "experience", "education", "summary"]
 
         # Get baseline score
-        baseline_score = self.ranker.score(resume, job_description)
+        baseline_score = self._baseline_score(resume, job_description)
+
+        # Locate every section once up front, then cut each out by its span.
+        # Sections are searched separately because they may overlap (e.g.
+        # "experience" inside a skills section); a single alternation scan
+        # cannot return overlapping matches and was no faster when made exact
+        text = resume["text"]
+        matches = {section: self._find_section(text, section) for section in sections}
 
         contributions = {}
 
         for section in sections:
+            # An absent section leaves the text unchanged; skip the model call
+            if matches[section] is None:
+                contributions[section] = 0.0
+                continue
+
             # Remove section
-            modified_text = self._remove_section(resume["text"], section)
+            modified_text = self._cut_span(text, matches[section])
             modified_resume = {**resume, "text": modified_text}
 
             # Get new score
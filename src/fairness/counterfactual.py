@@ -3,29 +3,236 @@
 Tests how ranking changes under controlled perturbations.
 """
 
-from typing import List, Dict, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+import os
 import numpy as np
 from .perturbations import PerturbationGenerator
+from ..utils.hashing import resumes_digest, text_digest
+
+
+# Standard fairness tests: name -> (progress label, perturbation type, fixed kwargs)
+FAIRNESS_TESTS = {
+    "gender_proxy": ("gender proxy", "gender_pronoun", {"direction": "to_neutral"}),
+    "name_redaction": ("name redaction", "name_redaction", {}),
+    "university_swap": ("university prestige", "university_swap", {}),
+    "gap_insertion": ("employment gap", "gap_insertion", {"gap_months": 6}),
+}
 
 
 class CounterfactualTester:
     """Test ranking fairness using counterfactual perturbations."""
 
-    def __init__(self, ranker: Any, perturbation_config: Dict = None):
+    def __init__(
+        self,
+        ranker: Any,
+        perturbation_config: Dict = None,
+        rankings_cache_size: int = 32,
+    ):
         """Initialize counterfactual tester.
 
         Args:
             ranker: Ranking model with rank() method
             perturbation_config: Configuration for perturbations
+            rankings_cache_size: Maximum number of unperturbed rankings kept
+                for reuse
         """
         self.ranker = ranker
-        self.perturbation_generator = PerturbationGenerator(perturbation_config or {})
+        self.perturbation_config = perturbation_config or {}
+        self.perturbation_generator = PerturbationGenerator(self.perturbation_config)
+        self.rankings_cache_size = rankings_cache_size
+        # (resumes digest, job digest) -> ranking of the unperturbed resumes,
+        # least recent first
+        self._original_rankings_cache: OrderedDict = OrderedDict()
+
+    def _original_rankings(
+        self,
+        resumes: List[Dict[str, Any]],
+        job_description: str,
+    ) -> List[Tuple[str, float]]:
+        """Rank the unperturbed resumes, reusing earlier results for the same input.
+
+        Args:
+            resumes: List of resumes
+            job_description: Job description text
+
+        Returns:
+            List of (resume_id, score) tuples
+        """
+        key = (resumes_digest(resumes), text_digest(job_description))
+        if key in self._original_rankings_cache:
+            self._original_rankings_cache.move_to_end(key)
+            return self._original_rankings_cache[key]
+
+        rankings = self.ranker.rank(job_description, resumes)
+
+        if self.rankings_cache_size > 0:
+            self._original_rankings_cache[key] = rankings
+            if len(self._original_rankings_cache) > self.rankings_cache_size:
+                self._original_rankings_cache.popitem(last=False)
+
+        return rankings
+
+    @staticmethod
+    def perturb_resumes(
+        generator: PerturbationGenerator,
+        resumes: List[Dict[str, Any]],
+        perturbation_type: str,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Create perturbed copies of resumes.
+
+        Args:
+            generator: Perturbation generator
+            resumes: List of resumes
+            perturbation_type: Type of perturbation to apply
+            **kwargs: Additional perturbation arguments
+
+        Returns:
+            Resumes with perturbed text (other fields shared with the originals)
+        """
+        return [
+            {
+                **resume,
+                "text": generator.apply_perturbation(
+                    resume["text"],
+                    perturbation_type,
+                    **kwargs
+                ),
+            }
+            for resume in resumes
+        ]
+
+    @classmethod
+    def build_perturbations(
+        cls,
+        resumes: List[Dict[str, Any]],
+        perturbation_config: Dict = None,
+        university_tiers: Dict[str, List[str]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Perturb resumes once for every standard fairness test.
+
+        Perturbations do not depend on the ranker, so the result can be
+        shared by several testers via run_all_tests(perturbations=...).
+
+        Args:
+            resumes: List of resumes
+            perturbation_config: Configuration for perturbations
+            university_tiers: Optional university tier configuration
+
+        Returns:
+            Dictionary of test_name -> perturbed resumes
+        """
+        generator = PerturbationGenerator(perturbation_config or {})
+
+        return {
+            test_name: cls.perturb_resumes(generator, resumes, perturbation_type, **kwargs)
+            for test_name, (perturbation_type, kwargs) in cls._test_specs(university_tiers).items()
+        }
+
+    @staticmethod
+    def _test_specs(
+        university_tiers: Dict[str, List[str]] = None,
+    ) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Perturbation type and arguments of each standard fairness test."""
+        specs = {}
+        for test_name, (_, perturbation_type, kwargs) in FAIRNESS_TESTS.items():
+            if test_name == "university_swap":
+                if not university_tiers:
+                    continue
+                kwargs = {"university_tiers": university_tiers}
+            specs[test_name] = (perturbation_type, kwargs)
+        return specs
+
+    @staticmethod
+    def _rank_array(
+        rankings: List[Tuple[str, float]],
+        id_to_pos: Dict[str, int],
+    ) -> np.ndarray:
+        """Rank of each resume, indexed by its position in the resume list.
+
+        Args:
+            rankings: List of (resume_id, score) tuples, best first
+            id_to_pos: Resume id -> position in the resume list
+
+        Returns:
+            Int array where entry i is the rank of the i-th resume
+        """
+        positions = np.fromiter(
+            (id_to_pos[rid] for rid, _ in rankings), dtype=np.intp, count=len(rankings)
+        )
+        if positions.size != len(id_to_pos):
+            raise ValueError("Ranking must contain every resume exactly once")
+
+        ranks = np.empty(positions.size, dtype=np.int64)
+        ranks[positions] = np.arange(positions.size)
+        return ranks
+
+    @staticmethod
+    def _score_rank_array(
+        scores: np.ndarray,
+        resumes: List[Dict[str, Any]],
+        id_to_pos: Dict[str, int],
+    ) -> np.ndarray:
+        """Rank of each resume from its score, as _rank_array() of rank() output.
+
+        Ties keep their input order, like the stable descending sort rank() uses.
+
+        Args:
+            scores: Score of each resume in resumes
+            resumes: Scored resumes
+            id_to_pos: Resume id -> position in the original resume list
+
+        Returns:
+            Int array where entry i is the rank of the i-th original resume
+        """
+        order = np.argsort(-scores, kind="stable")
+        return CounterfactualTester._rank_array(
+            [(resumes[i]["id"], scores[i]) for i in order], id_to_pos
+        )
+
+    @staticmethod
+    def _rank_change_stats(
+        perturbation_type: str,
+        original_ranks: np.ndarray,
+        new_ranks: np.ndarray,
+    ) -> Dict[str, Any]:
+        """Summarize how far each resume moved between two rankings.
+
+        Args:
+            perturbation_type: Type of perturbation tested
+            original_ranks: Original rank of each resume, by position
+            new_ranks: Rank after perturbation of each resume, by position
+
+        Returns:
+            Dictionary with test results
+        """
+        rank_changes = np.abs(new_ranks - original_ranks).astype(np.int32)
+
+        # Count significantly affected resumes (change > 5 positions)
+        significantly_affected = int(np.count_nonzero(rank_changes > 5))
+        affected_percentage = (significantly_affected / rank_changes.size) * 100
+
+        return {
+            "perturbation_type": perturbation_type,
+            "mean_rank_change": float(rank_changes.mean()),
+            "median_rank_change": float(np.median(rank_changes)),
+            "max_rank_change": int(rank_changes.max()),
+            "std_rank_change": float(rank_changes.std()),
+            "affected_percentage": float(affected_percentage),
+            "num_resumes": int(rank_changes.size),
+            "rank_changes": rank_changes,
+        }
 
     def test_single_perturbation(
         self,
         resumes: List[Dict[str, Any]],
         job_description: str,
         perturbation_type: str,
+        perturbed_resumes: Optional[List[Dict[str, Any]]] = None,
+        original_rankings: Optional[List[Tuple[str, float]]] = None,
+        original_ranks: Optional[np.ndarray] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Test impact of a single perturbation type.
@@ -34,63 +241,37 @@ class CounterfactualTester:
             resumes: List of resumes
             job_description: Job description text
             perturbation_type: Type of perturbation to test
+            perturbed_resumes: Precomputed perturbed resumes (built if None)
+            original_rankings: Precomputed rankings of resumes (ranked if None)
+            original_ranks: Precomputed original rank of each resume, by
+                position in resumes; takes precedence over original_rankings
             **kwargs: Additional perturbation arguments
 
         Returns:
             Dictionary with test results
         """
+        id_to_pos = {resume["id"]: i for i, resume in enumerate(resumes)}
+
         # Get original rankings
-        original_rankings = self.ranker.rank(job_description, resumes)
-        original_rank_dict = {rid: rank for rank, (rid, _) in enumerate(original_rankings)}
+        if original_ranks is None:
+            if original_rankings is None:
+                original_rankings = self._original_rankings(resumes, job_description)
+            original_ranks = self._rank_array(original_rankings, id_to_pos)
 
         # Apply perturbations and re-rank
-        rank_changes = []
-        perturbed_resumes = []
-
-        for resume in resumes:
-            # Create perturbed version
-            perturbed_text = self.perturbation_generator.apply_perturbation(
-                resume["text"],
+        if perturbed_resumes is None:
+            perturbed_resumes = self.perturb_resumes(
+                self.perturbation_generator,
+                resumes,
                 perturbation_type,
                 **kwargs
             )
 
-            perturbed_resume = {
-                **resume,
-                "text": perturbed_text,
-            }
-            perturbed_resumes.append(perturbed_resume)
-
         # Get new rankings
         new_rankings = self.ranker.rank(job_description, perturbed_resumes)
-        new_rank_dict = {rid: rank for rank, (rid, _) in enumerate(new_rankings)}
-
-        # Calculate rank changes
-        for resume_id in original_rank_dict.keys():
-            original_rank = original_rank_dict[resume_id]
-            new_rank = new_rank_dict[resume_id]
-            rank_change = abs(new_rank - original_rank)
-            rank_changes.append(rank_change)
-
-        # Calculate metrics
-        mean_rank_change = np.mean(rank_changes)
-        max_rank_change = np.max(rank_changes)
-        median_rank_change = np.median(rank_changes)
+        new_ranks = self._rank_array(new_rankings, id_to_pos)
 
-        # Count significantly affected resumes (change > 5 positions)
-        significantly_affected = sum(1 for change in rank_changes if change > 5)
-        affected_percentage = (significantly_affected / len(resumes)) * 100
-
-        return {
-            "perturbation_type": perturbation_type,
-            "mean_rank_change": float(mean_rank_change),
-            "median_rank_change": float(median_rank_change),
-            "max_rank_change": int(max_rank_change),
-            "std_rank_change": float(np.std(rank_changes)),
-            "affected_percentage": float(affected_percentage),
-            "num_resumes": len(resumes),
-            "rank_changes": rank_changes,
-        }
+        return self._rank_change_stats(perturbation_type, original_ranks, new_ranks)
 
     def test_gender_proxy(
         self,
@@ -184,13 +365,25 @@ class CounterfactualTester:
         resumes: List[Dict[str, Any]],
         job_description: str,
         university_tiers: Dict[str, List[str]] = None,
+        perturbations: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        workers: Optional[int] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """Run all fairness tests.
 
+        Rankers with score_batch() score the perturbed resumes of every test
+        in one call, since their scores do not depend on the other resumes in
+        the batch. Otherwise each test calls rank(), on a thread pool if the
+        ranker declares thread_safe = True (rank() keeps no shared mutable
+        state) and one test at a time otherwise.
+
         Args:
             resumes: List of resumes
             job_description: Job description text
             university_tiers: Optional university tier configuration
+            perturbations: Output of build_perturbations() for these resumes,
+                to share perturbed resumes across testers (built if None)
+            workers: Number of threads for rank()-based tests on thread-safe
+                rankers (defaults to the CPU count, at most one per test)
 
         Returns:
             Dictionary of test_name -> results
@@ -199,26 +392,65 @@ class CounterfactualTester:
 
         print("Running fairness tests...")
 
-        # Gender proxy test
-        print("  - Testing gender proxy...")
-        results["gender_proxy"] = self.test_gender_proxy(resumes, job_description)
+        if perturbations is None:
+            perturbations = self.build_perturbations(
+                resumes,
+                self.perturbation_config,
+                university_tiers,
+            )
 
-        # Name redaction test
-        print("  - Testing name redaction...")
-        results["name_redaction"] = self.test_name_redaction(resumes, job_description)
+        # The unperturbed ranking is the same for every test
+        id_to_pos = {resume["id"]: i for i, resume in enumerate(resumes)}
+        original_ranks = self._rank_array(
+            self._original_rankings(resumes, job_description), id_to_pos
+        )
 
-        # University swap test
-        if university_tiers:
-            print("  - Testing university prestige...")
-            results["university_swap"] = self.test_university_swap(
+        def run_test(test_name: str, perturbation_type: str) -> Dict[str, Any]:
+            return self.test_single_perturbation(
                 resumes,
                 job_description,
-                university_tiers,
+                perturbation_type,
+                perturbed_resumes=perturbations[test_name],
+                original_ranks=original_ranks,
+            )
+
+        specs = self._test_specs(university_tiers)
+        workers = min(workers or os.cpu_count() or 1, len(specs))
+
+        if hasattr(self.ranker, "score_batch"):
+            all_perturbed = [
+                resume for test_name in specs for resume in perturbations[test_name]
+            ]
+            scores = np.asarray(
+                self.ranker.score_batch(all_perturbed, job_description), dtype=np.float64
             )
 
-        # Gap insertion test
-        print("  - Testing employment gap...")
-        results["gap_insertion"] = self.test_gap_insertion(resumes, job_description)
+            start = 0
+            for test_name, (perturbation_type, _) in specs.items():
+                print(f"  - Testing {FAIRNESS_TESTS[test_name][0]}...")
+                perturbed = perturbations[test_name]
+                new_ranks = self._score_rank_array(
+                    scores[start:start + len(perturbed)], perturbed, id_to_pos
+                )
+                start += len(perturbed)
+                results[test_name] = self._rank_change_stats(
+                    perturbation_type, original_ranks, new_ranks
+                )
+        elif workers <= 1 or not getattr(self.ranker, "thread_safe", False):
+            # Shared tokenizers and torch modules are not safe to call concurrently
+            for test_name, (perturbation_type, _) in specs.items():
+                print(f"  - Testing {FAIRNESS_TESTS[test_name][0]}...")
+                results[test_name] = run_test(test_name, perturbation_type)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    test_name: executor.submit(run_test, test_name, perturbation_type)
+                    for test_name, (perturbation_type, _) in specs.items()
+                }
+                # Report progress in test order, as each result is collected
+                for test_name, future in futures.items():
+                    print(f"  - Testing {FAIRNESS_TESTS[test_name][0]}...")
+                    results[test_name] = future.result()
 
         print("Fairness tests complete.")
 
@@ -26,10 +26,10 @@ class FairnessMetrics:
         Returns:
             Demographic parity difference
         """
-        rate_a = np.mean([s >= threshold for s in scores_group_a])
-        rate_b = np.mean([s >= threshold for s in scores_group_b])
+        rate_a = (np.asarray(scores_group_a, dtype=np.float64) >= threshold).mean()
+        rate_b = (np.asarray(scores_group_b, dtype=np.float64) >= threshold).mean()
 
-        return abs(rate_a - rate_b)
+        return float(abs(rate_a - rate_b))
 
     @staticmethod
     def rank_position_variance(
@@ -45,8 +45,11 @@ class FairnessMetrics:
         Returns:
             Variance in rank changes
         """
-        rank_changes = [abs(o - p) for o, p in zip(original_ranks, perturbed_ranks)]
-        return float(np.var(rank_changes))
+        # Pair positions up to the shorter list, as zip() would
+        n = min(len(original_ranks), len(perturbed_ranks))
+        original = np.asarray(original_ranks[:n], dtype=np.float64)
+        perturbed = np.asarray(perturbed_ranks[:n], dtype=np.float64)
+        return float(np.var(np.abs(original - perturbed)))
 
     @staticmethod
     def consistency_score(
@@ -62,8 +65,10 @@ class FairnessMetrics:
         Returns:
             Consistency score (0-1, higher is better)
         """
-        consistent_count = sum(1 for change in rank_changes if change <= max_acceptable_change)
-        return consistent_count / len(rank_changes) if rank_changes else 0.0
+        changes = np.asarray(rank_changes)
+        if not changes.size:
+            return 0.0
+        return float((changes <= max_acceptable_change).mean())
 
     @staticmethod
     def fairness_threshold_rate(
@@ -4,8 +4,207 @@
 We never infer or predict race, gender, age, etc.
 """
 
+import random
 import re
-from typing import Dict, List, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from ..utils.hashing import text_digest
+
+
+# Pronoun swaps per direction: lowercase source word -> replacement
+PRONOUN_MAPS = {
+    "to_neutral": {
+        'he': 'they',
+        'him': 'them',
+        'his': 'their',
+        'himself': 'themselves',
+        'she': 'they',
+        'her': 'their',
+        'hers': 'theirs',
+        'herself': 'themselves',
+    },
+    "to_male": {
+        'they': 'he',
+        'them': 'him',
+        'their': 'his',
+        'theirs': 'his',
+        'themselves': 'himself',
+        'she': 'he',
+        'her': 'his',
+        'hers': 'his',
+        'herself': 'himself',
+    },
+    "to_female": {
+        'they': 'she',
+        'them': 'her',
+        'their': 'her',
+        'theirs': 'hers',
+        'themselves': 'herself',
+        'he': 'she',
+        'him': 'her',
+        'his': 'her',
+        'himself': 'herself',
+    },
+}
+
+# One alternation per direction, so a single scan swaps every pronoun
+PRONOUN_PATTERNS = {
+    direction: re.compile(
+        r'\b(?:' + '|'.join(sorted(mapping, key=len, reverse=True)) + r')\b',
+        re.IGNORECASE,
+    )
+    for direction, mapping in PRONOUN_MAPS.items()
+}
+
+# Common gendered organizations, matched in a single scan (the names cannot
+# overlap, so one alternation replaces exactly what separate passes would)
+GENDERED_ORG_PATTERN = re.compile(
+    r'\b(?:Women in Tech|Women in Engineering|Girls Who Code'
+    r'|Society of Women Engineers|Fraternity|Sorority)\b',
+    re.IGNORECASE,
+)
+
+# ASCII text that starts and ends with a word character and has no backslash
+_WORD_EDGES_PATTERN = re.compile(r'(?a:\w(?:[^\\\x80-\U0010ffff]*\w)?)')
+
+# Header line made only of capitalized words, likely a name
+NAME_LINE_PATTERN = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$')
+
+EXPERIENCE_HEADER_PATTERN = re.compile(r'(experience|employment|work history)', re.IGNORECASE)
+
+BULLET_PATTERN = re.compile(r'[•\-\*]\s+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def _whole_word_pattern(word: str) -> re.Pattern:
+    """Case-insensitive whole-word pattern for a literal word or phrase."""
+    return re.compile(rf'\b{re.escape(word)}\b', re.IGNORECASE)
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether an ASCII character is a regex word character."""
+    return char.isalnum() or char == '_'
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """Whether whole-word matches of two words can share characters.
+
+    Both words must start and end with a word character; a shared span only
+    counts where it begins and ends on word boundaries.
+    """
+    for outer, inner in ((a, b), (b, a)):
+        start = outer.find(inner)
+        while start != -1:
+            end = start + len(inner)
+            if (start == 0 or not _is_word_char(outer[start - 1])) and (
+                end == len(outer) or not _is_word_char(outer[end])
+            ):
+                return True
+            start = outer.find(inner, start + 1)
+
+        # A suffix of outer is a prefix of inner
+        for k in range(1, min(len(outer), len(inner))):
+            if (
+                outer.endswith(inner[:k])
+                and not _is_word_char(outer[-k - 1])
+                and not _is_word_char(inner[k])
+            ):
+                return True
+
+    return False
+
+
+@lru_cache(maxsize=32)
+def _build_swap_regex(
+    words: Tuple[str, ...],
+    replacements: Tuple[str, ...],
+) -> Optional[Tuple[re.Pattern, Dict[str, str]]]:
+    """Build a single-scan whole-word substitution, if it is exact.
+
+    One alternation replaces the same text as one pass per word unless
+    words can overlap each other or a replacement (where pass order matters,
+    or a pass can match inside an earlier replacement), or a word or
+    replacement is not ASCII starting and ending with a word character
+    (non-word edges let matches abut across a word boundary, case-insensitive
+    non-ASCII equivalents may not share a lowercase form, and re.sub treats
+    backslashes in a replacement as escapes).
+
+    Args:
+        words: Words or phrases to replace, in pass order
+        replacements: Replacement for each word
+
+    Returns:
+        (pattern, lowercase word -> replacement), or None if the words must
+        be replaced one pass at a time
+    """
+    if not words:
+        return None
+
+    names = [word.lower() for word in words]
+    if not all(_WORD_EDGES_PATTERN.fullmatch(s) for s in names + list(replacements)):
+        return None
+
+    others = set(names)
+    for name in others:
+        for other in others - {name}:
+            if _overlaps(name, other):
+                return None
+        for replacement in replacements:
+            if _overlaps(name, replacement.lower()):
+                return None
+
+    # Earlier words win for duplicates, as in the sequential passes
+    lookup = {}
+    for name, replacement in zip(names, replacements):
+        lookup.setdefault(name, replacement)
+
+    pattern = re.compile(
+        r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b',
+        re.IGNORECASE,
+    )
+    return pattern, lookup
+
+
+def _replace_words(
+    text: str,
+    words: Tuple[str, ...],
+    replacements: Tuple[str, ...],
+) -> str:
+    """Replace whole words case-insensitively, as one pass per word in order.
+
+    Args:
+        text: Input text
+        words: Words or phrases to replace
+        replacements: Replacement for each word
+
+    Returns:
+        Text with replacements applied
+    """
+    swapper = _build_swap_regex(words, replacements)
+    if swapper is not None:
+        pattern, lookup = swapper
+
+        def swap(match: re.Match) -> str:
+            found = match.group(0)
+            replacement = lookup.get(found.lower())
+            if replacement is None:
+                # Matched through a non-ASCII case equivalent
+                replacement = next(
+                    replacements[i] for i, word in enumerate(words)
+                    if _whole_word_pattern(word).fullmatch(found)
+                )
+            return replacement
+
+        return pattern.sub(swap, text)
+
+    result = text
+    for word, replacement in zip(words, replacements):
+        result = _whole_word_pattern(word).sub(replacement, result)
+
+    return result
 
 
 def gender_pronoun_swap(text: str, direction: str = "to_neutral") -> str:
@@ -18,50 +217,22 @@ def gender_pronoun_swap(text: str, direction: str = "to_neutral") -> str:
     Returns:
         Text with swapped pronouns
     """
-    if direction == "to_neutral":
-        # Replace gendered pronouns with they/them
-        replacements = {
-            r'\bhe\b': 'they',
-            r'\bhim\b': 'them',
-            r'\bhis\b': 'their',
-            r'\bhimself\b': 'themselves',
-            r'\bshe\b': 'they',
-            r'\bher\b': 'their',
-            r'\bhers\b': 'theirs',
-            r'\bherself\b': 'themselves',
-        }
-    elif direction == "to_male":
-        replacements = {
-            r'\bthey\b': 'he',
-            r'\bthem\b': 'him',
-            r'\btheir\b': 'his',
-            r'\btheirs\b': 'his',
-            r'\bthemselves\b': 'himself',
-            r'\bshe\b': 'he',
-            r'\bher\b': 'his',
-            r'\bhers\b': 'his',
-            r'\bherself\b': 'himself',
-        }
-    elif direction == "to_female":
-        replacements = {
-            r'\bthey\b': 'she',
-            r'\bthem\b': 'her',
-            r'\btheir\b': 'her',
-            r'\btheirs\b': 'hers',
-            r'\bthemselves\b': 'herself',
-            r'\bhe\b': 'she',
-            r'\bhim\b': 'her',
-            r'\bhis\b': 'her',
-            r'\bhimself\b': 'herself',
-        }
-    else:
+    mapping = PRONOUN_MAPS.get(direction)
+    if mapping is None:
         raise ValueError(f"Unknown direction: {direction}")
 
-    result = text
-    for pattern, replacement in replacements.items():
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    def swap(match: re.Match) -> str:
+        word = match.group(0)
+        replacement = mapping.get(word.lower())
+        if replacement is None:
+            # Matched through a non-ASCII case equivalent (e.g. "ſ" for "s")
+            replacement = next(
+                target for source, target in mapping.items()
+                if re.fullmatch(source, word, re.IGNORECASE)
+            )
+        return replacement
 
-    return result
+    return PRONOUN_PATTERNS[direction].sub(swap, text)
 
 
 def remove_gendered_organizations(text: str) -> str:
@@ -73,21 +244,7 @@ def remove_gendered_organizations(text: str) -> str:
     Returns:
         Text with gendered organization mentions removed
     """
-    # Common gendered organization patterns
-    gendered_orgs = [
-        r'\bWomen in Tech\b',
-        r'\bWomen in Engineering\b',
-        r'\bGirls Who Code\b',
-        r'\bSociety of Women Engineers\b',
-        r'\bFraternity\b',
-        r'\bSorority\b',
-    ]
-
-    result = text
-    for pattern in gendered_orgs:
-        result = re.sub(pattern, '[ORGANIZATION]', result, flags=re.IGNORECASE)
-
-    return result
+    return GENDERED_ORG_PATTERN.sub('[ORGANIZATION]', text)
 
 
 def redact_names(text: str, placeholder: str = "[NAME]") -> str:
@@ -100,20 +257,36 @@ def redact_names(text: str, placeholder: str = "[NAME]") -> str:
     Returns:
         Text with names redacted
     """
-    lines = text.split('\n')
-    redacted_lines = []
+    # First few lines often contain names; only those are scanned, and the
+    # rest of the text is copied once at the end (or not at all)
+    pieces = []
+    start = 0
+    redacted = False
+
+    for _ in range(3):
+        end = text.find('\n', start)
+        line_end = len(text) if end == -1 else end
+        line = text[start:line_end].strip()
+
+        # Simple heuristic: capitalized words at start
+        if line and NAME_LINE_PATTERN.match(line):
+            pieces.append(placeholder)
+            redacted = True
+        else:
+            pieces.append(text[start:line_end])
 
-    for i, line in enumerate(lines):
-        # First few lines often contain names
-        if i < 3 and line.strip():
-            # Simple heuristic: capitalized words at start
-            if re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$', line.strip()):
-                redacted_lines.append(placeholder)
-                continue
+        if end == -1:
+            break
+        pieces.append('\n')
+        start = end + 1
+    else:
+        # The fourth line onwards is kept as is
+        pieces.append(text[start:])
 
-        redacted_lines.append(line)
+    if not redacted:
+        return text
 
-    return '\n'.join(redacted_lines)
+    return ''.join(pieces)
 
 
 def swap_university(
@@ -139,20 +312,10 @@ def swap_university(
     from_unis = university_tiers[from_tier]
     to_unis = university_tiers[to_tier]
 
-    result = text
-
-    # Replace universities from from_tier with equivalent from to_tier
-    for i, uni in enumerate(from_unis):
-        # Use corresponding university from to_tier (cycling if needed)
-        replacement = to_unis[i % len(to_unis)]
-        result = re.sub(
-            rf'\b{re.escape(uni)}\b',
-            replacement,
-            result,
-            flags=re.IGNORECASE
-        )
+    # Use corresponding university from to_tier (cycling if needed)
+    replacements = tuple(to_unis[i % len(to_unis)] for i in range(len(from_unis)))
 
-    return result
+    return _replace_words(text, tuple(from_unis), replacements)
 
 
 def insert_gap(
@@ -177,11 +340,7 @@ def insert_gap(
 
     if position == "before_last_job":
         # Try to find "Experience" section and insert near the end
-        experience_match = re.search(
-            r'(experience|employment|work history)',
-            text,
-            re.IGNORECASE
-        )
+        experience_match = EXPERIENCE_HEADER_PATTERN.search(text)
 
         if experience_match:
             insert_pos = experience_match.end()
@@ -193,33 +352,35 @@ def insert_gap(
     return text[:mid_point] + gap_text + text[mid_point:]
 
 
-def introduce_typos(text: str, typo_rate: float = 0.02) -> str:
+def introduce_typos(text: str, typo_rate: float = 0.02, seed: int = 42) -> str:
     """Introduce random typos for robustness testing.
 
+    Each typo swaps two adjacent characters, after the first, of a word
+    longer than three characters.
+
     Args:
         text: Input text
         typo_rate: Proportion of words to modify
+        seed: Seed for the typo positions (same seed, same typos)
 
     Returns:
         Text with typos
     """
-    import random
-    random.seed(42)  # For reproducibility
+    # Local generator for reproducibility without touching global RNG state
+    rng = random.Random(seed)
 
     words = text.split()
     num_typos = int(len(words) * typo_rate)
 
-    # Select random words to modify
-    typo_indices = random.sample(range(len(words)), min(num_typos, len(words)))
+    # Select random words to modify among those long enough for a swap
+    eligible = [idx for idx, word in enumerate(words) if len(word) > 3]
+    typo_indices = rng.sample(eligible, min(num_typos, len(eligible)))
 
     for idx in typo_indices:
+        # Simple typo: swap two adjacent characters
         word = words[idx]
-        if len(word) > 3:
-            # Simple typo: swap two adjacent characters
-            pos = random.randint(1, len(word) - 2)
-            word_list = list(word)
-            word_list[pos], word_list[pos + 1] = word_list[pos + 1], word_list[pos]
-            words[idx] = ''.join(word_list)
+        pos = rng.randint(1, len(word) - 2)
+        words[idx] = word[:pos] + word[pos + 1] + word[pos] + word[pos + 2:]
 
     return ' '.join(words)
 
@@ -234,19 +395,14 @@ def replace_synonyms(text: str, replacements: Dict[str, List[str]]) -> str:
     Returns:
         Text with synonyms
     """
-    result = text
+    # Replace with first synonym
+    pairs = [(word, synonyms[0]) for word, synonyms in replacements.items() if synonyms]
 
-    for word, synonyms in replacements.items():
-        if synonyms:
-            # Replace with first synonym
-            result = re.sub(
-                rf'\b{re.escape(word)}\b',
-                synonyms[0],
-                result,
-                flags=re.IGNORECASE
-            )
-
-    return result
+    return _replace_words(
+        text,
+        tuple(word for word, _ in pairs),
+        tuple(synonym for _, synonym in pairs),
+    )
 
 
 def remove_formatting(text: str) -> str:
@@ -259,27 +415,42 @@ def remove_formatting(text: str) -> str:
         Text with formatting removed
     """
     # Remove bullet points
-    result = re.sub(r'[•\-\*]\s+', '', text)
-
-    # Remove extra whitespace
-    result = re.sub(r'\s+', ' ', result)
+    result = BULLET_PATTERN.sub('', text)
 
-    # Remove multiple newlines
-    result = re.sub(r'\n+', '\n', result)
+    # Remove extra whitespace (this also collapses newlines, so no separate
+    # newline pass is needed)
+    result = WHITESPACE_PATTERN.sub(' ', result)
 
     return result.strip()
 
 
+def _freeze(value: Any) -> Hashable:
+    """Convert perturbation arguments into a hashable cache key.
+
+    Dictionaries keep their insertion order, which decides the result of
+    order-sensitive perturbations such as synonym replacement.
+    """
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class PerturbationGenerator:
     """Generate counterfactual perturbations of resumes."""
 
-    def __init__(self, config: Dict = None):
+    def __init__(self, config: Dict = None, cache_size: int = 4096):
         """Initialize perturbation generator.
 
         Args:
             config: Configuration dictionary with perturbation settings
+            cache_size: Maximum number of perturbed texts kept for reuse
         """
         self.config = config or {}
+        self.cache_size = cache_size
+        # (text digest, type, frozen kwargs) -> perturbed text, least recent first
+        self._cache: OrderedDict = OrderedDict()
 
     def apply_perturbation(
         self,
@@ -289,6 +460,9 @@ class PerturbationGenerator:
     ) -> str:
         """Apply a perturbation to text.
 
+        Every perturbation is deterministic (typos use a fixed seed), so
+        results are cached per (text, type, arguments).
+
         Args:
             text: Input text
             perturbation_type: Type of perturbation
@@ -297,6 +471,24 @@ class PerturbationGenerator:
         Returns:
             Perturbed text
         """
+        frozen_kwargs = tuple(sorted((name, _freeze(value)) for name, value in kwargs.items()))
+        key = (text_digest(text), perturbation_type, frozen_kwargs)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        result = self._perturb(text, perturbation_type, **kwargs)
+
+        if self.cache_size > 0:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return result
+
+    @staticmethod
+    def _perturb(text: str, perturbation_type: str, **kwargs) -> str:
+        """Apply a perturbation to text, without caching."""
         if perturbation_type == "gender_pronoun":
             direction = kwargs.get("direction", "to_neutral")
             return gender_pronoun_swap(text, direction)
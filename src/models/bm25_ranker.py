@@ -1,13 +1,25 @@
 """BM25 ranking model."""
 
+import heapq
+import math
+from collections import Counter
 from typing import List, Tuple, Dict, Any
 from rank_bm25 import BM25Okapi
 import numpy as np
 
 
+# BM25Okapi idf of every term in a one-document corpus: the raw idf
+# log(0.5) - log(1.5) is negative, so it is floored at epsilon (0.25)
+# times the average idf, which is that same value
+SINGLE_DOC_IDF = 0.25 * (math.log(0.5) - math.log(1.5))
+
+
 class BM25Ranker:
     """Rank resumes using BM25 algorithm."""
 
+    # rank() with resumes builds its own index, so concurrent calls are safe
+    thread_safe = True
+
     def __init__(self, k1: float = 1.5, b: float = 0.75):
         """Initialize BM25 ranker.
 
@@ -111,13 +123,19 @@ class BM25Ranker:
             BM25 score
         """
         query_tokens = self._tokenize(job_description)
-        doc_tokens = self._tokenize(resume["text"])
+        doc_counts = Counter(self._tokenize(resume["text"]))
 
-        # Create single-document BM25
-        bm25 = BM25Okapi([doc_tokens], k1=self.k1, b=self.b)
-        score = bm25.get_scores(query_tokens)[0]
+        # Single-document BM25Okapi in closed form: every term has a negative
+        # raw idf, so all get the epsilon floor, and the document is exactly
+        # the average length
+        norm = self.k1 * (1 - self.b + self.b * 1.0)
+        score = 0.0
+        for term in query_tokens:
+            freq = doc_counts.get(term)
+            if freq:
+                score += SINGLE_DOC_IDF * (freq * (self.k1 + 1) / (freq + norm))
 
-        return float(score)
+        return score
 
     def get_top_matching_terms(
         self,
@@ -138,18 +156,16 @@ class BM25Ranker:
         query_tokens = self._tokenize(job_description)
         doc_tokens = self._tokenize(resume["text"])
 
-        # Find common terms
-        common_terms = set(query_tokens) & set(doc_tokens)
+        # Count each side once; common terms keep job description order
+        query_counts = Counter(query_tokens)
+        doc_counts = Counter(doc_tokens)
 
         # Simple frequency-based scoring
-        term_scores = []
-        for term in common_terms:
-            query_freq = query_tokens.count(term)
-            doc_freq = doc_tokens.count(term)
-            score = query_freq * doc_freq  # Simple heuristic
-
-            term_scores.append((term, score))
-
-        # Sort and return top N
-        term_scores.sort(key=lambda x: x[1], reverse=True)
-        return term_scores[:top_n]
+        term_scores = [
+            (term, query_freq * doc_counts[term])  # Simple heuristic
+            for term, query_freq in query_counts.items()
+            if term in doc_counts
+        ]
+
+        # Select top N
+        return heapq.nlargest(top_n, term_scores, key=lambda x: x[1])
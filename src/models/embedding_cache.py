@@ -0,0 +1,78 @@
+"""Disk cache for text embeddings.
+
+Each embedding is stored as its own .npy file keyed by a hash of the model
+key and the text, in subdirectories sharded by the first two hex digits, so
+unchanged texts are never re-encoded across runs.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable, List, Union
+
+import numpy as np
+
+
+def embedding_key(model_key: str, text: str) -> str:
+    """Hash a (model, text) pair into a cache key.
+
+    Args:
+        model_key: Identifies the encoder (name plus anything that changes outputs)
+        text: Text that is embedded
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(f"{model_key}\0{text}".encode("utf-8")).hexdigest()
+
+
+def get_or_compute(
+    encode_fn: Callable[[List[str]], np.ndarray],
+    model_key: str,
+    texts: List[str],
+    cache_dir: Union[str, Path],
+) -> np.ndarray:
+    """Load cached embeddings and encode only the texts that are missing.
+
+    Args:
+        encode_fn: Encodes a list of texts into a (len(texts), dim) array
+        model_key: Identifies the encoder (name plus anything that changes outputs)
+        texts: Texts to embed
+        cache_dir: Root directory of the cache
+
+    Returns:
+        Float32 matrix of shape (len(texts), dim), in the order of texts
+    """
+    if not texts:
+        return np.asarray(encode_fn(texts), dtype=np.float32)
+
+    cache_dir = Path(cache_dir)
+    paths = []
+    for text in texts:
+        key = embedding_key(model_key, text)
+        paths.append(cache_dir / key[:2] / f"{key}.npy")
+
+    embeddings = [None] * len(texts)
+    missing = []
+    for i, path in enumerate(paths):
+        if path.exists():
+            embeddings[i] = np.load(path)
+        else:
+            missing.append(i)
+
+    if missing:
+        new_embeddings = np.asarray(
+            encode_fn([texts[i] for i in missing]), dtype=np.float32
+        )
+        for i, embedding in zip(missing, new_embeddings):
+            embeddings[i] = embedding
+
+            # Write atomically so a concurrent reader never sees a partial file;
+            # the tmp name is per process so concurrent writers never share it
+            paths[i].parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = paths[i].with_name(f"{paths[i].name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, embedding)
+            os.replace(tmp_path, paths[i])
+
+    return np.stack(embeddings).astype(np.float32, copy=False)
@@ -14,6 +14,31 @@ import re
 import numpy as np
 
 
+# Gap indicators (negative signals), matched against lowercased text
+GAP_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"employment gap",
+        r"career break",
+        r"gap of \d+ months?",
+        r"unemployed",
+        r"seeking opportunities",
+        r"freelance period",  # Sometimes indicates gaps
+    )
+)
+
+# Continuity indicators (positive signals), matched against lowercased text
+CONTINUITY_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"currently employed",
+        r"present\b",  # "2020 - Present"
+        r"continuous",
+        r"\d+ years of experience",
+    )
+)
+
+
 class HybridRanker:
     """
     Hybrid ranker combining semantic similarity with structured signals.
@@ -70,19 +95,104 @@ class HybridRanker:
             "other": 0.05          # Reserved for location, etc.
         }
         
+        # Fitted resume corpus (used when rank() gets no resumes)
+        self.resumes = None
+        self._fitted_signals = None
+        self._structured_scores = None
+        
         # Validate weights sum to 1.0
         total = sum(self.weights.values())
         assert abs(total - 1.0) < 0.01, f"Weights must sum to 1.0, got {total}"
     
     def fit(self, resumes: List[Dict[str, Any]]) -> "HybridRanker":
-        """Fit underlying semantic model."""
+        """Fit underlying semantic model and precompute structured signals.
+        
+        Structured signals do not depend on the job description, so they
+        (and their weighted sum) are computed once per fitted resume.
+        """
         self.semantic_ranker.fit(resumes)
+        self.resumes = resumes
+        self._fitted_signals = [self._structured_signals(r) for r in resumes]
+        self._structured_scores = np.array(
+            [self._weight_signals(*signals) for signals in self._fitted_signals]
+        )
         return self
     
+    def _structured_signals(self, resume: Dict[str, Any]) -> Tuple[float, float]:
+        """Education and continuity scores, lowercasing the text only once."""
+        text = resume.get("text", "").lower()
+        return (
+            self._calculate_education_score(resume, text),
+            self._calculate_continuity_score(resume, text)
+        )
+    
+    def _weight_signals(self, education_score: float, continuity_score: float) -> float:
+        """Weighted sum of the non-semantic components."""
+        return (
+            self.weights["education"] * education_score +
+            self.weights["continuity"] * continuity_score +
+            self.weights["other"] * 0.5  # Neutral default
+        )
+    
+    def _structured_score(self, resume: Dict[str, Any]) -> float:
+        """Weighted sum of the non-semantic components for one resume."""
+        return self._weight_signals(*self._structured_signals(resume))
+    
+    def _hybrid_scores(
+        self,
+        semantic_scores: np.ndarray,
+        structured_scores: np.ndarray
+    ) -> np.ndarray:
+        """
+        Combine semantic and structured scores into hybrid totals.
+        
+        Every batch scoring path goes through here, so the same resume gets
+        a bit-identical score from rank(), corpus_scores() and score_batch().
+        Semantic scores are widened to float64 before weighting.
+        """
+        semantic_scores = np.asarray(semantic_scores, dtype=np.float64)
+        return self.weights["semantic"] * semantic_scores + structured_scores
+    
+    def corpus_scores(self, job_description: str) -> np.ndarray:
+        """
+        Score every fitted resume against a job description.
+        
+        Returns:
+            Hybrid scores aligned with the order passed to fit()
+        """
+        if self._structured_scores is None:
+            raise ValueError("Must call fit() first")
+        
+        semantic_scores = self.semantic_ranker.corpus_scores(job_description)
+        
+        if not self.enable_structured_signals:
+            return semantic_scores
+        
+        return self._hybrid_scores(semantic_scores, self._structured_scores)
+    
+    def score(self, resume: Dict[str, Any], job_description: str) -> float:
+        """Score a single resume against job description (hybrid total)."""
+        semantic_score = self.semantic_ranker.score(resume, job_description)
+        
+        if not self.enable_structured_signals:
+            return semantic_score
+        
+        return self.weights["semantic"] * semantic_score + self._structured_score(resume)
+    
+    def score_batch(self, resumes: List[Dict[str, Any]], job_description: str) -> np.ndarray:
+        """Score many resumes (hybrid total), encoding their texts in one batch."""
+        semantic_scores = self.semantic_ranker.score_batch(resumes, job_description)
+        
+        if not self.enable_structured_signals:
+            return semantic_scores
+        
+        structured_scores = np.array([self._structured_score(r) for r in resumes])
+        return self._hybrid_scores(semantic_scores, structured_scores)
+    
     def rank(
         self,
         job_description: str,
-        resumes: List[Dict[str, Any]],
+        resumes: Optional[List[Dict[str, Any]]] = None,
         return_components: bool = False
     ) -> List[Tuple[str, float]]:
         """
@@ -90,7 +200,8 @@ class HybridRanker:
         
         Args:
             job_description: Job description text
-            resumes: List of resume dictionaries
+            resumes: List of resume dictionaries (default: fitted corpus,
+                     scored from the semantic ranker's cached embeddings)
             return_components: If True, return score breakdown
             
         Returns:
@@ -98,38 +209,47 @@ class HybridRanker:
             If return_components=True, returns (resume_id, total_score, components_dict)
         """
         # Get semantic scores
-        semantic_rankings = self.semantic_ranker.rank(job_description, resumes)
+        use_fitted = resumes is None
+        if use_fitted:
+            if self.resumes is None:
+                raise ValueError("Must call fit() first or provide resumes")
+            resumes = self.resumes
+            semantic_rankings = self.semantic_ranker.rank(job_description)
+        else:
+            semantic_rankings = self.semantic_ranker.rank(job_description, resumes)
         semantic_scores = {rid: score for rid, score in semantic_rankings}
         
         # If structured signals disabled, return semantic only
         if not self.enable_structured_signals:
             return semantic_rankings
         
+        # Components 2-3: Education signal (explicit, auditable) and
+        # employment continuity (precomputed for the fitted corpus)
+        if use_fitted:
+            signals = self._fitted_signals
+            structured_scores = self._structured_scores
+        else:
+            signals = [self._structured_signals(r) for r in resumes]
+            structured_scores = np.array([self._weight_signals(*sig) for sig in signals])
+        
+        # Component 1: Semantic relevance (normalized 0-1)
+        semantic_column = [semantic_scores.get(r["id"], 0.0) for r in resumes]
+        
+        # Weighted combination (explicit, transparent)
+        total_scores = self._hybrid_scores(semantic_column, structured_scores)
+        
         # Calculate hybrid scores
         hybrid_scores = []
         
-        for resume in resumes:
+        for i, resume in enumerate(resumes):
             resume_id = resume["id"]
-            
-            # Component 1: Semantic relevance (normalized 0-1)
-            semantic_score = semantic_scores.get(resume_id, 0.0)
-            
-            # Component 2: Education signal (explicit, auditable)
-            education_score = self._calculate_education_score(resume)
-            
-            # Component 3: Employment continuity
-            continuity_score = self._calculate_continuity_score(resume)
+            semantic_score = semantic_column[i]
+            education_score, continuity_score = signals[i]
             
             # Component 4: Other signals (placeholder)
             other_score = 0.5  # Neutral default
             
-            # Weighted combination (explicit, transparent)
-            total_score = (
-                self.weights["semantic"] * semantic_score +
-                self.weights["education"] * education_score +
-                self.weights["continuity"] * continuity_score +
-                self.weights["other"] * other_score
-            )
+            total_score = float(total_scores[i])
             
             if return_components:
                 components = {
@@ -148,17 +268,26 @@ class HybridRanker:
         
         return hybrid_scores
     
-    def _calculate_education_score(self, resume: Dict[str, Any]) -> float:
+    def _calculate_education_score(
+        self,
+        resume: Dict[str, Any],
+        text: Optional[str] = None
+    ) -> float:
         """
         Calculate education prestige score (explicit, auditable).
         
         This is NOT hiding bias - it's making it measurable.
         Real systems do this explicitly rather than relying on embedding accidents.
         
+        Args:
+            resume: Resume dictionary
+            text: Already-lowercased resume text (computed if None)
+        
         Returns:
             Score between 0.0 and 1.0
         """
-        text = resume.get("text", "").lower()
+        if text is None:
+            text = resume.get("text", "").lower()
         
         # Extract university mentions
         max_tier_score = 0.4  # Default for unknown
@@ -169,7 +298,11 @@ class HybridRanker:
         
         return max_tier_score
     
-    def _calculate_continuity_score(self, resume: Dict[str, Any]) -> float:
+    def _calculate_continuity_score(
+        self,
+        resume: Dict[str, Any],
+        text: Optional[str] = None
+    ) -> float:
         """
         Calculate employment continuity score.
         
@@ -178,37 +311,26 @@ class HybridRanker:
         - Career breaks
         - Continuous employment
         
+        Args:
+            resume: Resume dictionary
+            text: Already-lowercased resume text (computed if None)
+        
         Returns:
             Score between 0.0 and 1.0
         """
-        text = resume.get("text", "").lower()
+        if text is None:
+            text = resume.get("text", "").lower()
         
         # Gap indicators (negative signals)
-        gap_patterns = [
-            r"employment gap",
-            r"career break",
-            r"gap of \d+ months?",
-            r"unemployed",
-            r"seeking opportunities",
-            r"freelance period"  # Sometimes indicates gaps
-        ]
-        
         gap_count = 0
-        for pattern in gap_patterns:
-            if re.search(pattern, text):
+        for pattern in GAP_PATTERNS:
+            if pattern.search(text):
                 gap_count += 1
         
         # Continuity indicators (positive signals)
-        continuity_patterns = [
-            r"currently employed",
-            r"present\b",  # "2020 - Present"
-            r"continuous",
-            r"\d+ years of experience"
-        ]
-        
         continuity_count = 0
-        for pattern in continuity_patterns:
-            if re.search(pattern, text):
+        for pattern in CONTINUITY_PATTERNS:
+            if pattern.search(text):
                 continuity_count += 1
         
         # Score: penalize gaps, reward continuity
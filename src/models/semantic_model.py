@@ -4,25 +4,47 @@ This module provides pretrained embedding-based ranking WITHOUT fine-tuning,
 maintaining focus on evaluation infrastructure rather than model optimization.
 """
 
-from typing import List, Tuple, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Tuple, Dict, Any, Optional
+from functools import lru_cache
+import platform
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 from pathlib import Path
 
+from .embedding_cache import get_or_compute
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+# torch and sentence_transformers are imported where they are used, so
+# subclasses with their own encoder (StaticRanker) never load them.
+
+
+_IS_ARM = platform.machine().lower() in ("arm64", "aarch64")
+
 
 class SemanticRanker:
     """Rank resumes using semantic similarity with sentence transformers.
 
     Uses pretrained models WITHOUT fine-tuning to maintain focus on
     evaluation and auditing rather than model optimization.
+
+    Invariant: every stored or cached embedding (resume matrix, query
+    vectors) is L2-normalized float32, so cosine similarity is computed
+    as a plain dot product throughout.
     """
 
+    # Directory of the on-disk resume embedding cache (None disables it)
+    embedding_cache_dir: Optional[str] = None
+
     def __init__(
         self,
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
         device: str = "cpu",
         cache_dir: Optional[str] = None,
+        quantize: bool = False,
+        backend: str = "torch",
+        onnx_dir: Optional[str] = None,
+        embedding_cache_dir: Optional[str] = None,
     ):
         """Initialize semantic ranker.
 
@@ -30,53 +52,178 @@ class SemanticRanker:
             model_name: Name of sentence transformer model
             device: Device to use ('cpu' or 'cuda')
             cache_dir: Directory to cache models
+            quantize: Apply INT8 dynamic quantization (CPU only, torch backend)
+            backend: 'torch' or 'onnx' (INT8 ONNX Runtime export)
+            onnx_dir: Directory for the exported ONNX model
+            embedding_cache_dir: Directory to cache resume embeddings on disk
+                across runs (None disables it)
         """
         self.model_name = model_name
         self.device = device
+        self.backend = backend
+        self.quantized = False
+        self.embedding_cache_dir = embedding_cache_dir
+        self._init_caches()
 
         # Load pretrained model (NO FINE-TUNING)
-        self.model = SentenceTransformer(
-            model_name,
-            device=device,
-            cache_folder=cache_dir,
-        )
+        if backend == "onnx":
+            self.model = self._load_onnx_model(cache_dir, onnx_dir)
+            self.quantized = True
+        elif backend == "torch":
+            from sentence_transformers import SentenceTransformer
+
+            self.model = SentenceTransformer(
+                model_name,
+                device=device,
+                cache_folder=cache_dir,
+            )
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
 
-        # Cache for embeddings
+        # Quantize before any encoding so resume and JD embeddings match
+        if quantize and device == "cpu" and backend == "torch":
+            self.quantize()
+
+    def _init_caches(self, query_cache_size: int = 256) -> None:
+        """Reset the resume and job description embedding caches.
+
+        Args:
+            query_cache_size: Maximum number of cached job description embeddings
+        """
+        # Cache for embeddings (L2-normalized float32, one row per resume)
         self.resume_embeddings = None
         self.resume_ids = None
+        self._resume_texts = None
+        self._id_to_row = {}
+
+        # Job description embeddings keyed by text (bounded LRU)
+        self._cached_query = lru_cache(maxsize=query_cache_size)(self._encode_query)
+
+    def quantize(self) -> "SemanticRanker":
+        """Apply INT8 dynamic quantization to the model's Linear layers.
+
+        Weights are stored as INT8 and activations are quantized on the fly,
+        which speeds up CPU inference of the attention/FFN projections.
+        Cached embeddings from an earlier fit() are not recomputed.
+
+        Returns:
+            self
+        """
+        import torch
+
+        engine = "qnnpack" if _IS_ARM else "fbgemm"
+        if engine in torch.backends.quantized.supported_engines:
+            torch.backends.quantized.engine = engine
+
+        self.model = torch.quantization.quantize_dynamic(
+            self.model,
+            {torch.nn.Linear},
+            dtype=torch.qint8,
+        )
+        self.quantized = True
+        self._cached_query.cache_clear()
+
+        return self
+
+    def _load_onnx_model(
+        self,
+        cache_dir: Optional[str],
+        onnx_dir: Optional[str],
+    ) -> "SentenceTransformer":
+        """Load an INT8-quantized ONNX Runtime model, exporting it on first use.
+
+        The quantized export is written once under ``onnx_dir`` and reused by
+        later processes, so only the first load pays the export cost.
+
+        Args:
+            cache_dir: Directory to cache the original model
+            onnx_dir: Directory for the exported ONNX model
+
+        Returns:
+            SentenceTransformer running on ONNX Runtime
+        """
+        from sentence_transformers import (
+            SentenceTransformer,
+            export_dynamic_quantized_onnx_model,
+        )
+
+        quantization_config = "arm64" if _IS_ARM else "avx2"
+        export_dir = Path(onnx_dir or "data/processed/onnx") / self.model_name.replace("/", "__")
+        # avx2 exports quint8 weights, the other configs qint8
+        pattern = f"onnx/model_*int8_{quantization_config}.onnx"
+
+        if not any(export_dir.glob(pattern)):
+            model = SentenceTransformer(
+                self.model_name,
+                device=self.device,
+                cache_folder=cache_dir,
+                backend="onnx",
+            )
+            model.save(str(export_dir))
+            export_dynamic_quantized_onnx_model(
+                model,
+                quantization_config,
+                str(export_dir),
+            )
+
+        file_name = next(export_dir.glob(pattern)).relative_to(export_dir).as_posix()
+
+        return SentenceTransformer(
+            str(export_dir),
+            device=self.device,
+            backend="onnx",
+            model_kwargs={
+                "file_name": file_name,
+                "provider": "CPUExecutionProvider",
+            },
+        )
 
     def encode(
         self,
         texts: List[str],
         batch_size: int = 32,
         show_progress: bool = False,
+        normalize: bool = False,
     ) -> np.ndarray:
         """Encode texts to embeddings.
 
+        SentenceTransformer.encode already sorts inputs by length before
+        batching, so batches are padded only to their own longest member.
+
         Args:
             texts: List of texts to encode
             batch_size: Batch size for encoding
             show_progress: Show progress bar
+            normalize: L2-normalize embeddings (cosine becomes a dot product)
 
         Returns:
             Numpy array of embeddings
         """
-        embeddings = self.model.encode(
-            texts,
-            batch_size=batch_size,
-            show_progress_bar=show_progress,
-            convert_to_numpy=True,
-        )
-
-        return embeddings
+        import torch
+
+        # Inference mode also skips autograd version-counter bookkeeping
+        with torch.inference_mode():
+            return self.model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=show_progress,
+                convert_to_numpy=True,
+                normalize_embeddings=normalize,
+            )
 
     def fit(
         self,
         resumes: List[Dict[str, Any]],
-        batch_size: int = 32,
+        batch_size: int = 64,
     ) -> "SemanticRanker":
         """Cache resume embeddings.
 
+        Embeddings are stored as a single L2-normalized float32 matrix so
+        that ranking only needs to encode the job description and take one
+        matrix-vector product. Refitting reuses the rows of resumes that are
+        already cached (same id and text), so fitting a HybridRanker on the
+        corpus its semantic ranker was fitted on encodes nothing.
+
         Args:
             resumes: List of resume dictionaries with 'id' and 'text' keys
             batch_size: Batch size for encoding
@@ -84,18 +231,161 @@ class SemanticRanker:
         Returns:
             self
         """
-        self.resume_ids = [r["id"] for r in resumes]
-        resume_texts = [r["text"] for r in resumes]
-
-        # Encode resumes
-        self.resume_embeddings = self.encode(
-            resume_texts,
+        # Encode resumes (only those not already cached)
+        embeddings = self._embed_resumes(
+            resumes,
             batch_size=batch_size,
             show_progress=True,
         )
 
+        self.resume_ids = [r["id"] for r in resumes]
+        self._resume_texts = [r["text"] for r in resumes]
+        self._id_to_row = {rid: i for i, rid in enumerate(self.resume_ids)}
+        self.resume_embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
         return self
 
+    def _embed_resumes(
+        self,
+        resumes: List[Dict[str, Any]],
+        batch_size: int = 32,
+        show_progress: bool = False,
+    ) -> np.ndarray:
+        """Get normalized embeddings, encoding only resumes not already cached.
+
+        A cached row is reused only when both the id and the text match the
+        fitted corpus, so perturbed copies that keep their id are re-encoded.
+
+        Args:
+            resumes: List of resume dictionaries with 'id' and 'text' keys
+            batch_size: Batch size for encoding
+            show_progress: Show progress bar
+
+        Returns:
+            Float32 matrix of shape (len(resumes), dim)
+        """
+        rows = [None] * len(resumes)
+        missing = []
+
+        for i, resume in enumerate(resumes):
+            row = self._id_to_row.get(resume.get("id"))
+            if (
+                row is not None
+                and self._resume_texts is not None
+                and self._resume_texts[row] == resume["text"]
+            ):
+                rows[i] = row
+            else:
+                missing.append(i)
+
+        if not missing:
+            return self.resume_embeddings[rows]
+
+        new_embeddings = self._encode_corpus(
+            [resumes[i]["text"] for i in missing],
+            batch_size=batch_size,
+            show_progress=show_progress,
+        )
+
+        if len(missing) == len(resumes):
+            return new_embeddings
+
+        embeddings = np.empty(
+            (len(resumes), new_embeddings.shape[1]), dtype=np.float32
+        )
+        cached = [i for i in range(len(resumes)) if rows[i] is not None]
+        embeddings[cached] = self.resume_embeddings[[rows[i] for i in cached]]
+        embeddings[missing] = new_embeddings
+
+        return embeddings
+
+    def _encode_corpus(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        show_progress: bool = False,
+    ) -> np.ndarray:
+        """Encode resume texts to normalized float32, via the disk cache if enabled.
+
+        Args:
+            texts: List of texts to encode
+            batch_size: Batch size for encoding
+            show_progress: Show progress bar
+
+        Returns:
+            Float32 matrix of shape (len(texts), dim)
+        """
+        def encode(batch: List[str]) -> np.ndarray:
+            return self.encode(
+                batch,
+                batch_size=batch_size,
+                show_progress=show_progress,
+                normalize=True,
+            ).astype(np.float32, copy=False)
+
+        if self.embedding_cache_dir is None:
+            return encode(texts)
+
+        # Quantized and FP32 encoders produce different vectors
+        model_key = f"{self.model_name}|{self.backend}|{'int8' if self.quantized else 'fp32'}"
+        return get_or_compute(encode, model_key, texts, self.embedding_cache_dir)
+
+    def _encode_query(self, text: str) -> np.ndarray:
+        """Encode a job description to a read-only normalized float32 vector."""
+        embedding = self.encode([text], normalize=True)[0].astype(np.float32, copy=False)
+        embedding.flags.writeable = False
+        return embedding
+
+    def embed_query(self, text: str) -> np.ndarray:
+        """Get the normalized embedding of a job description.
+
+        Repeated queries with the same text (e.g. re-running an audit for
+        the same JD) are served from an LRU cache instead of re-encoding.
+
+        Args:
+            text: Job description text
+
+        Returns:
+            Read-only float32 embedding vector
+        """
+        return self._cached_query(text)
+
+    def corpus_scores(self, job_description: str) -> np.ndarray:
+        """Score every fitted resume against a job description.
+
+        Args:
+            job_description: Job description text
+
+        Returns:
+            Cosine similarities aligned with the order passed to fit()
+        """
+        if self.resume_embeddings is None:
+            raise ValueError("Must call fit() first")
+
+        return self.resume_embeddings @ self.embed_query(job_description)
+
+    def rank_cached(
+        self,
+        job_description: str,
+        top_k: int = None,
+    ) -> List[Tuple[str, float]]:
+        """Rank the fitted corpus using the cached embedding matrix.
+
+        Args:
+            job_description: Job description text
+            top_k: Return only top k results
+
+        Returns:
+            List of (resume_id, similarity_score) tuples, sorted by score
+        """
+        scores = self.corpus_scores(job_description)
+
+        order = np.argsort(-scores, kind="stable")
+        if top_k is not None:
+            order = order[:top_k]
+
+        return [(self.resume_ids[i], float(scores[i])) for i in order]
+
     def rank(
         self,
         job_description: str,
@@ -112,29 +402,22 @@ class SemanticRanker:
         Returns:
             List of (resume_id, similarity_score) tuples, sorted by score
         """
-        if resumes is not None:
-            # Encode new resumes
-            resume_ids = [r["id"] for r in resumes]
-            resume_texts = [r["text"] for r in resumes]
-            resume_embeddings = self.encode(resume_texts)
-        else:
+        if resumes is None:
             # Use cached embeddings
-            if self.resume_embeddings is None:
-                raise ValueError("Must call fit() first or provide resumes")
-            resume_ids = self.resume_ids
-            resume_embeddings = self.resume_embeddings
+            return self.rank_cached(job_description, top_k=top_k)
+
+        # Reuse cached rows, encode only new or modified resumes
+        resume_ids = [r["id"] for r in resumes]
+        resume_embeddings = self._embed_resumes(resumes)
 
-        # Encode job description
-        jd_embedding = self.encode([job_description])[0]
+        # Encode job description (cached by text)
+        jd_embedding = self.embed_query(job_description)
 
-        # Compute cosine similarities
-        similarities = cosine_similarity(
-            jd_embedding.reshape(1, -1),
-            resume_embeddings,
-        )[0]
+        # Cosine similarity is a dot product on normalized embeddings
+        similarities = resume_embeddings @ jd_embedding
 
         # Create ranked list
-        rankings = list(zip(resume_ids, similarities))
+        rankings = [(rid, float(s)) for rid, s in zip(resume_ids, similarities)]
         rankings.sort(key=lambda x: x[1], reverse=True)
 
         if top_k is not None:
@@ -152,15 +435,9 @@ class SemanticRanker:
         Returns:
             Cosine similarity score
         """
-        resume_embedding = self.encode([resume["text"]])[0]
-        jd_embedding = self.encode([job_description])[0]
+        resume_embedding = self.encode([resume["text"]], normalize=True)[0]
 
-        similarity = cosine_similarity(
-            resume_embedding.reshape(1, -1),
-            jd_embedding.reshape(1, -1),
-        )[0, 0]
-
-        return float(similarity)
+        return float(resume_embedding @ self.embed_query(job_description))
 
     def get_embedding(self, text: str) -> np.ndarray:
         """Get embedding for a single text.
@@ -200,8 +477,14 @@ class SemanticRanker:
         """
         data = np.load(file_path, allow_pickle=True)
 
-        self.resume_embeddings = data["embeddings"]
+        embeddings = np.asarray(data["embeddings"], dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        self.resume_embeddings = np.ascontiguousarray(
+            embeddings / np.maximum(norms, 1e-12), dtype=np.float32
+        )
         self.resume_ids = data["resume_ids"].tolist()
+        self._resume_texts = None
+        self._id_to_row = {rid: i for i, rid in enumerate(self.resume_ids)}
 
         # Verify model compatibility
         saved_model = str(data.get("model_name", ""))
@@ -223,12 +506,31 @@ class SemanticRanker:
         Returns:
             List of similarity scores
         """
-        resume_embeddings = self.encode(resume_texts)
-        jd_embedding = self.encode([job_description])[0]
-
-        similarities = cosine_similarity(
-            jd_embedding.reshape(1, -1),
-            resume_embeddings,
-        )[0]
+        resume_embeddings = self.encode(resume_texts, normalize=True).astype(
+            np.float32, copy=False
+        )
+        similarities = resume_embeddings @ self.embed_query(job_description)
 
         return similarities.tolist()
+
+    def score_batch(
+        self,
+        resumes: List[Dict[str, Any]],
+        job_description: str,
+    ) -> np.ndarray:
+        """Score many resumes (e.g. perturbed variants) in one encode call.
+
+        Resumes whose id and text match the fitted corpus reuse their cached
+        embeddings, exactly as in rank().
+
+        Args:
+            resumes: Resume dictionaries with 'text' key (and 'id' to use
+                the cached embeddings)
+            job_description: Job description text
+
+        Returns:
+            Cosine similarity scores, in the order of resumes
+        """
+        similarities = self._embed_resumes(resumes) @ self.embed_query(job_description)
+
+        return similarities.astype(np.float64)
@@ -0,0 +1,74 @@
+"""Static embedding model using Model2Vec.
+
+A Model2Vec model is a distillation of a sentence transformer into a static
+token embedding table: encoding is a token lookup plus mean pooling, with no
+transformer layers at inference time.
+"""
+
+from typing import List
+import numpy as np
+from model2vec import StaticModel
+
+from .semantic_model import SemanticRanker
+
+
+class StaticRanker(SemanticRanker):
+    """Rank resumes using Model2Vec static embeddings.
+
+    Much faster than SemanticRanker on CPU at some cost in accuracy.
+    Shares the cached-matrix ranking path of SemanticRanker; only the
+    encoder differs.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "minishlab/M2V_base_output",
+        device: str = "cpu",
+    ):
+        """Initialize static ranker.
+
+        Args:
+            model_name: Name or path of a Model2Vec model
+            device: Kept for interface compatibility (always runs on CPU)
+        """
+        self.model_name = model_name
+        self.device = device
+        self.backend = "static"
+        self.quantized = False
+        self._init_caches()
+
+        # Load pretrained static model (NO FINE-TUNING)
+        self.model = StaticModel.from_pretrained(model_name)
+
+    def encode(
+        self,
+        texts: List[str],
+        batch_size: int = 1024,
+        show_progress: bool = False,
+        normalize: bool = False,
+    ) -> np.ndarray:
+        """Encode texts to mean-pooled static embeddings.
+
+        Args:
+            texts: List of texts to encode
+            batch_size: Batch size for encoding
+            show_progress: Show progress bar
+            normalize: L2-normalize embeddings (cosine becomes a dot product)
+
+        Returns:
+            Numpy array of embeddings
+        """
+        embeddings = np.asarray(
+            self.model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=show_progress,
+            ),
+            dtype=np.float32,
+        )
+
+        if normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.maximum(norms, 1e-12)
+
+        return embeddings
@@ -3,11 +3,14 @@
 from typing import List, Tuple, Dict, Any
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 
 class TFIDFRanker:
-    """Rank resumes using TF-IDF cosine similarity."""
+    """Rank resumes using TF-IDF cosine similarity.
+
+    Vectors are L2-normalized float32 CSR rows, so cosine similarity is a
+    plain sparse dot product against the cached resume matrix.
+    """
 
     def __init__(
         self,
@@ -30,6 +33,7 @@ class TFIDFRanker:
             min_df=min_df,
             max_df=max_df,
             stop_words="english",
+            dtype=np.float32,
         )
         self.resume_vectors = None
         self.resume_ids = None
@@ -51,6 +55,22 @@ class TFIDFRanker:
 
         return self
 
+    def corpus_scores(self, job_description: str) -> np.ndarray:
+        """Score every fitted resume against a job description.
+
+        Args:
+            job_description: Job description text
+
+        Returns:
+            Cosine similarities aligned with the order passed to fit()
+        """
+        if self.resume_vectors is None:
+            raise ValueError("Must call fit() first")
+
+        jd_vector = self.vectorizer.transform([job_description])
+
+        return (self.resume_vectors @ jd_vector.T).toarray().ravel()
+
     def rank(
         self,
         job_description: str,
@@ -82,11 +102,11 @@ class TFIDFRanker:
         # Transform job description
         jd_vector = self.vectorizer.transform([job_description])
 
-        # Compute similarities
-        similarities = cosine_similarity(jd_vector, resume_vectors)[0]
+        # Cosine similarity of L2-normalized rows is a dot product
+        similarities = (resume_vectors @ jd_vector.T).toarray().ravel()
 
         # Create ranked list
-        rankings = list(zip(resume_ids, similarities))
+        rankings = [(rid, float(s)) for rid, s in zip(resume_ids, similarities)]
         rankings.sort(key=lambda x: x[1], reverse=True)
 
         if top_k is not None:
@@ -107,10 +127,25 @@ class TFIDFRanker:
         resume_vector = self.vectorizer.transform([resume["text"]])
         jd_vector = self.vectorizer.transform([job_description])
 
-        similarity = cosine_similarity(jd_vector, resume_vector)[0, 0]
+        similarity = (jd_vector @ resume_vector.T).toarray()[0, 0]
 
         return float(similarity)
 
+    def score_batch(self, resumes: List[Dict[str, Any]], job_description: str) -> np.ndarray:
+        """Score many resumes against a job description in one sparse product.
+
+        Args:
+            resumes: Resume dictionaries with 'text' key
+            job_description: Job description text
+
+        Returns:
+            Similarity scores, in the order of resumes
+        """
+        resume_vectors = self.vectorizer.transform([resume["text"] for resume in resumes])
+        jd_vector = self.vectorizer.transform([job_description])
+
+        return (resume_vectors @ jd_vector.T).toarray().ravel()
+
     def get_feature_names(self) -> List[str]:
         """Get feature names from vectorizer.
 
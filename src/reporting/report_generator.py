@@ -1,10 +1,11 @@
 """Generate comprehensive evaluation reports."""
 
-import json
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
 
+import orjson
+
 
 class ReportGenerator:
     """Generate evaluation and fairness reports."""
@@ -30,9 +31,11 @@ class ReportGenerator:
             filename: Output filename (without extension)
         """
         # Save JSON
+        # Rank changes are NumPy arrays; orjson serializes them natively
         json_path = self.output_dir / f"{filename}.json"
-        with open(json_path, "w") as f:
-            json.dump(results, f, indent=2)
+        json_path.write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
 
         # Generate HTML
         html_path = self.output_dir / f"{filename}.html"
@@ -0,0 +1,34 @@
+"""Content hashing helpers for in-memory result caches."""
+
+import hashlib
+from typing import Any, Dict, Iterable
+
+
+def text_digest(text: str) -> bytes:
+    """Hash a text into a short digest suitable as a cache key.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        16-byte BLAKE2s digest
+    """
+    return hashlib.blake2s(text.encode("utf-8"), digest_size=16).digest()
+
+
+def resumes_digest(resumes: Iterable[Dict[str, Any]]) -> bytes:
+    """Hash the ids and texts of a list of resumes, in order.
+
+    Args:
+        resumes: Resume dictionaries with 'id' and 'text' keys
+
+    Returns:
+        16-byte BLAKE2s digest
+    """
+    h = hashlib.blake2s(digest_size=16)
+    for resume in resumes:
+        h.update(str(resume["id"]).encode("utf-8"))
+        h.update(b"\0")
+        h.update(resume["text"].encode("utf-8"))
+        h.update(b"\0")
+    return h.digest()
@@ -48,3 +48,19 @@ def test_pii_detection():
 
     assert "email" in detected
     assert len(detected["email"]) == 1
+
+
+def test_extract_sections_case_insensitive_headers():
+    """Test that headers matching only case-insensitively still map to their section."""
+    parser = ResumeParser()
+
+    sections = parser.extract_sections("ſkills\npython\nEXPERIENCE\nEngineer at Acme")
+
+    assert sections == {"skills": "python", "experience": "Engineer at Acme"}
+
+
+def test_parser_backend_selection():
+    """Test that use_pdfplumber=False alone still selects PyPDF2."""
+    assert ResumeParser().use_pymupdf
+    assert not ResumeParser(use_pdfplumber=False).use_pymupdf
+    assert ResumeParser(use_pdfplumber=False, use_pymupdf=True).use_pymupdf
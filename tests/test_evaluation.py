@@ -41,6 +41,38 @@ def test_mrr():
     assert mrr == 1/3  # First relevant at position 3
 
 
+def test_mrr_ties():
+    """Test that tied scores do not move relevant items ahead."""
+    y_true = [1, 0, 0, 0]
+    y_pred = [2.0, 2.0, 2.0, 1.0]  # Relevant item tied with two others
+
+    mrr = calculate_mrr(y_true, y_pred, relevance_threshold=0.5)
+
+    # Same position as ranking by a reversed argsort
+    ranked = np.argsort(y_pred)[::-1]
+    assert mrr == 1 / (1 + list(ranked).index(0))
+    assert mrr < 1.0
+
+
+def test_mrr_matches_reversed_argsort():
+    """Test MRR against ranking by a reversed argsort, with and without ties."""
+    rng = np.random.default_rng(0)
+
+    for _ in range(500):
+        n = int(rng.integers(1, 40))
+        y_true = rng.integers(0, 2, n)
+        if rng.random() < 0.5:
+            y_pred = rng.integers(0, 4, n).astype(float)  # Many ties
+        else:
+            y_pred = rng.random(n)  # Tie-free fast path
+
+        ranked = np.argsort(y_pred)[::-1]
+        relevant_positions = np.flatnonzero(y_true[ranked] >= 0.5)
+        expected = 1.0 / (1 + relevant_positions[0]) if relevant_positions.size else 0.0
+
+        assert calculate_mrr(y_true, y_pred, relevance_threshold=0.5) == expected
+
+
 def test_spearman():
     """Test Spearman correlation."""
     ranking1 = [1, 2, 3, 4, 5]
@@ -0,0 +1,31 @@
+"""Tests for explainability modules."""
+
+import re
+
+import pytest
+from src.explainability.token_contribution import TokenContributionAnalyzer
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Python python PYTHON developer",
+        # "ſ" (long s) matches "s" case-insensitively but lowercases to itself
+        "ſkills: SQL, skills, Skills",
+        # Kelvin sign lowercases to "k"
+        "\u212aubernetes kubernetes",
+        # Capital sigma lowercases to "ς" or "σ" depending on context
+        "ΟΔΟΣ.ΟΔΟΣ οδος",
+        "Café CAFÉ straße",
+    ],
+)
+def test_token_removals_match_regex_substitution(text):
+    """Test that token removal matches one case-insensitive re.sub per token."""
+    analyzer = TokenContributionAnalyzer(ranker=None)
+
+    expected = [
+        (token, re.sub(rf"\b{re.escape(token)}\b", "", text, flags=re.IGNORECASE))
+        for token in dict.fromkeys(analyzer._tokenize(text))
+    ]
+
+    assert list(analyzer._token_removals(text)) == expected
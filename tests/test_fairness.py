@@ -1,13 +1,29 @@
 """Tests for fairness testing modules."""
 
+import re
+
 import pytest
+from src.fairness.counterfactual import CounterfactualTester
 from src.fairness.perturbations import (
+    PRONOUN_MAPS,
     gender_pronoun_swap,
     redact_names,
     introduce_typos,
+    remove_gendered_organizations,
+    replace_synonyms,
+    swap_university,
+    PerturbationGenerator,
+    _build_swap_regex,
 )
 
 
+def _sequential_swap(text, words, replacements):
+    """Reference: one case-insensitive whole-word substitution pass per word."""
+    for word, replacement in zip(words, replacements):
+        text = re.sub(rf"\b{re.escape(word)}\b", replacement, text, flags=re.IGNORECASE)
+    return text
+
+
 def test_gender_pronoun_swap():
     """Test pronoun swapping."""
     text = "He is a software engineer. His skills include Python."
@@ -18,6 +34,84 @@ def test_gender_pronoun_swap():
     assert "his" not in neutral.lower() or "their" in neutral.lower()
 
 
+def test_gender_pronoun_swap_matches_sequential_passes():
+    """Test that the single-scan swap matches one substitution pass per pronoun."""
+    text = "He said HIS team met him. She thanked Her manager; they thanked THEM themselves."
+
+    for direction, mapping in PRONOUN_MAPS.items():
+        expected = text
+        for source, target in mapping.items():
+            expected = re.sub(rf"\b{source}\b", target, expected, flags=re.IGNORECASE)
+
+        assert gender_pronoun_swap(text, direction) == expected
+
+    # Replacements are inserted as written, whatever the case of the match
+    assert gender_pronoun_swap("HE and He", "to_neutral") == "they and they"
+
+
+def test_gendered_organizations_match_sequential_passes():
+    """Test that the organization alternation matches one pass per organization."""
+    organizations = [
+        "Women in Tech", "Women in Engineering", "Girls Who Code",
+        "Society of Women Engineers", "Fraternity", "Sorority",
+    ]
+    text = "Member, WOMEN IN TECH and Society of Women Engineers; fraternity treasurer"
+
+    expected = _sequential_swap(text, organizations, ["[ORGANIZATION]"] * len(organizations))
+
+    assert remove_gendered_organizations(text) == expected
+
+
+def test_swap_university_single_scan():
+    """Test the single-scan university swap against sequential passes."""
+    tiers = {"tier1": ["MIT", "Stanford University"], "tier2": ["State University"]}
+    text = "BS, mit (2015). MS, STANFORD UNIVERSITY. Not MITx."
+
+    # Non-overlapping ASCII names take the single-scan path
+    assert _build_swap_regex(("MIT", "Stanford University"), ("State University",) * 2) is not None
+
+    # Replacements are inserted as written, whatever the case of the match
+    assert swap_university(text, tiers) == "BS, State University (2015). MS, State University. Not MITx."
+    assert swap_university(text, tiers) == _sequential_swap(
+        text, tiers["tier1"], ["State University", "State University"]
+    )
+
+
+def test_swap_university_overlap_fallback():
+    """Test that overlapping names fall back to sequential passes."""
+    # "Stanford" is inside "Stanford University", and the second replacement
+    # contains the first name, so pass order decides the result
+    tiers = {"tier1": ["Stanford University", "Stanford"], "tier2": ["Stanford State", "Rice"]}
+    text = "Stanford University alumni; Stanford staff"
+
+    assert _build_swap_regex(("Stanford University", "Stanford"), ("Stanford State", "Rice")) is None
+    assert swap_university(text, tiers) == _sequential_swap(
+        text, tiers["tier1"], tiers["tier2"]
+    ) == "Rice State alumni; Rice staff"
+
+
+def test_replace_synonyms_pinned_output():
+    """Test synonym replacement for overlapping and multi-word entries."""
+    text = "Led the team; developed tools. Team Lead for LED displays, then lead engineer."
+
+    # Character overlap without a shared word ("led"/"developed"): single scan
+    replacements = {"led": ["headed"], "developed": ["built"], "tools": []}
+    assert _build_swap_regex(("led", "developed"), ("headed", "built")) is not None
+    assert replace_synonyms(text, replacements) == (
+        "headed the team; built tools. Team Lead for headed displays, then lead engineer."
+    )
+
+    # Multi-word entry overlapping a single word, and a synonym containing a
+    # later entry: sequential passes in dictionary order
+    replacements = {"team lead": ["manager"], "lead": ["head"], "led": ["team lead"]}
+    assert _build_swap_regex(("team lead", "lead", "led"), ("manager", "head", "team lead")) is None
+    expected = "team lead the team; developed tools. manager for team lead displays, then head engineer."
+    assert replace_synonyms(text, replacements) == expected
+    assert expected == _sequential_swap(
+        text, list(replacements), [synonyms[0] for synonyms in replacements.values()]
+    )
+
+
 def test_name_redaction():
     """Test name redaction."""
     text = "John Smith\nSoftware Engineer\nExperience at Google"
@@ -41,6 +135,43 @@ def test_typo_introduction():
     assert abs(len(typo_text) - len(text)) < 5
 
 
+def test_perturbation_cache():
+    """Test that cached perturbations match uncached ones and respect arguments."""
+    generator = PerturbationGenerator(cache_size=2)
+    text = "He led the team at MIT. His work was cited."
+
+    first = generator.apply_perturbation(text, "gender_pronoun", direction="to_neutral")
+    assert first == gender_pronoun_swap(text, "to_neutral")
+    assert generator.apply_perturbation(text, "gender_pronoun", direction="to_neutral") == first
+
+    # Different arguments are cached separately
+    assert generator.apply_perturbation(text, "gender_pronoun", direction="to_female") != first
+
+    # Oldest entry is evicted past cache_size
+    generator.apply_perturbation(text, "name_redaction")
+    assert len(generator._cache) == 2
+
+
+def test_original_rankings_cache_evicts():
+    """Test that unperturbed rankings are reused and the oldest is evicted."""
+    class CountingRanker:
+        calls = 0
+
+        def rank(self, job_description, resumes):
+            CountingRanker.calls += 1
+            return [(resume["id"], 0.0) for resume in resumes]
+
+    tester = CounterfactualTester(CountingRanker(), rankings_cache_size=2)
+    resumes = [{"id": "r1", "text": "Python developer"}]
+
+    for job in ["job a", "job b", "job a", "job c", "job a", "job b"]:
+        tester._original_rankings(resumes, job)
+
+    # a, b miss; a hits; c misses and evicts b; a hits; b misses again
+    assert CountingRanker.calls == 4
+    assert len(tester._original_rankings_cache) == 2
+
+
 def test_counterfactual_stability():
     """Test that minimal perturbations should yield minimal rank changes."""
     # This is a conceptual test - actual implementation would need a real ranker
@@ -1,9 +1,12 @@
 """Tests for ranking models."""
 
+import numpy as np
 import pytest
+from src.models.embedding_cache import get_or_compute
 from src.models.tfidf_ranker import TFIDFRanker
 from src.models.bm25_ranker import BM25Ranker
 from src.models.skill_matcher import SkillMatcher
+from src.models.hybrid_ranker import HybridRanker
 
 
 @pytest.fixture
@@ -47,6 +50,40 @@ def test_bm25_ranker(sample_resumes):
     assert rankings[0][0] == "resume_1"
 
 
+def test_corpus_scores_match_rank(sample_resumes):
+    """Test corpus_scores agrees with rank() for fitted rankers."""
+    jd = "Looking for a Python developer with machine learning skills"
+
+    for ranker in [TFIDFRanker(), HybridRanker(semantic_ranker=TFIDFRanker())]:
+        ranker.fit(sample_resumes)
+
+        scores = ranker.corpus_scores(jd)
+        rankings = dict(ranker.rank(jd, sample_resumes))
+
+        for resume, score in zip(sample_resumes, scores):
+            assert score == pytest.approx(rankings[resume["id"]])
+            assert ranker.score(resume, jd) == pytest.approx(score)
+
+
+def test_hybrid_scores_identical_across_paths(sample_resumes):
+    """Test that every hybrid batch scoring path gives bit-identical scores."""
+    resumes = [
+        {**sample_resumes[0], "text": sample_resumes[0]["text"] + ", MIT, career break"},
+        {**sample_resumes[1], "text": sample_resumes[1]["text"] + ", currently employed"},
+    ]
+    jd = "Looking for a Python developer with machine learning skills"
+    ranker = HybridRanker(semantic_ranker=TFIDFRanker()).fit(resumes)
+
+    corpus = ranker.corpus_scores(jd).tolist()
+    batch = ranker.score_batch(resumes, jd).tolist()
+    fitted = dict(ranker.rank(jd))
+    passed = dict(ranker.rank(jd, resumes))
+
+    assert corpus == batch
+    assert corpus == [fitted[r["id"]] for r in resumes]
+    assert corpus == [passed[r["id"]] for r in resumes]
+
+
 def test_skill_matcher(sample_resumes):
     """Test skill matching."""
     matcher = SkillMatcher()
@@ -72,3 +109,20 @@ def test_skill_overlap():
     assert "SQL" in overlap["matched"]
     assert "Machine Learning" in overlap["missing"]
     assert "Java" in overlap["extra"]
+
+
+def test_embedding_cache_encodes_only_misses(tmp_path):
+    """Test that cached embeddings are reused across calls."""
+    encoded = []
+
+    def encode(texts):
+        encoded.extend(texts)
+        return np.array([[len(t), 1.0] for t in texts])
+
+    first = get_or_compute(encode, "model", ["a", "bb"], tmp_path)
+    second = get_or_compute(encode, "model", ["bb", "ccc", "a"], tmp_path)
+
+    assert encoded == ["a", "bb", "ccc"]
+    assert second.dtype == np.float32
+    np.testing.assert_array_equal(second, [[2, 1], [3, 1], [1, 1]])
+    np.testing.assert_array_equal(first, second[[2, 0]])